@@ -9,19 +9,55 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+from typing import Optional
+
 import numpy as np
 
+from numpy import ndarray
+
 # supported file types
 FILE_TYPES = [".h5 | .hdf5", ".csv"]
 
-# helper functions for plotting wave functions
+
+# helper functions for plotting wave functions; if given, the (real-valued) result
+# is written to the preallocated array `out`
+def _abs_sqr(x: ndarray, out: Optional[ndarray] = None) -> ndarray:
+    if np.iscomplexobj(x):
+        out = np.abs(x, out=out)
+        return np.square(out, out=out)
+    return np.square(x, out=out)
+
+
+def _abs(x: ndarray, out: Optional[ndarray] = None) -> ndarray:
+    return np.abs(x, out=out)
+
+
+def _real(x: ndarray, out: Optional[ndarray] = None) -> ndarray:
+    if out is None:
+        return np.real(x)
+    np.copyto(out, np.real(x))
+    return out
+
+
+def _imag(x: ndarray, out: Optional[ndarray] = None) -> ndarray:
+    if out is None:
+        # for real-valued x, np.imag returns a read-only array of zeros
+        return np.imag(x) if np.iscomplexobj(x) else np.zeros_like(x)
+    np.copyto(out, np.imag(x))
+    return out
+
+
 MODE_FUNC_DICT = {
-    "abs_sqr": (lambda x: np.abs(x) ** 2),
-    "abs": np.abs,
-    "real": np.real,
-    "imag": np.imag,
+    "abs_sqr": _abs_sqr,
+    "abs": _abs,
+    "real": _real,
+    "imag": _imag,
 }
 
+# modes whose MODE_FUNC_DICT function is insensitive to the overall sign of the
+# wave function, so that standardizing the sign beforehand can be skipped
+SIGN_INVARIANT_MODES = {"abs_sqr", "abs"}
+
 # the following string manipulations are used in automatic generation of default
 # ylabels of wavefunction plots
 MODE_STR_DICT = {
@@ -34,7 +34,6 @@ import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.core.units as units
 import scqubits.io_utils.fileio_serializers as serializers
-import scqubits.settings as settings
 import scqubits.utils.plotting as plot
 import scqubits.utils.spectrum_utils as spec_utils
 
@@ -858,31 +857,6 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             + disorder_c
         )
 
-    def _evals_calc(self, evals_count) -> ndarray:
-        hamiltonian_mat = self.hamiltonian()
-        evals = sparse.linalg.eigsh(
-            hamiltonian_mat,
-            k=evals_count,
-            return_eigenvectors=False,
-            sigma=0.0,
-            which="LM",
-            v0=settings.RANDOM_ARRAY[: self.hilbertdim()],
-        )
-        return np.sort(evals)
-
-    def _esys_calc(self, evals_count) -> Tuple[ndarray, ndarray]:
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sparse.linalg.eigsh(
-            hamiltonian_mat,
-            k=evals_count,
-            return_eigenvectors=True,
-            sigma=0.0,
-            which="LM",
-            v0=settings.RANDOM_ARRAY[: self.hilbertdim()],
-        )
-        evals, evecs = spec_utils.order_eigensystem(evals, evecs)
-        return evals, evecs
-
     def potential(self, phi, zeta, theta) -> float:
         """
         Returns full potential evaluated at :math:`\\phi, \\zeta, \\theta`
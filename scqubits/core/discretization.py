@@ -9,6 +9,8 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import functools
+
 from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
@@ -87,6 +89,14 @@ def band_matrix(
     return matrix
 
 
+@functools.lru_cache(maxsize=8)
+def _make_linspace_cached(min_val: float, max_val: float, pt_count: int) -> ndarray:
+    # the cached array is shared among all callers, hence made read-only
+    linspace = np.linspace(min_val, max_val, pt_count)
+    linspace.setflags(write=False)
+    return linspace
+
+
 class Grid1d(dispatch.DispatchClient, serializers.Serializable):
     """Data structure and methods for setting up discretized 1d coordinate grid,
     generating corresponding derivative matrices.
@@ -153,7 +163,7 @@ class Grid1d(dispatch.DispatchClient, serializers.Serializable):
         -------
         ndarray
         """
-        return np.linspace(self.min_val, self.max_val, self.pt_count)
+        return _make_linspace_cached(self.min_val, self.max_val, self.pt_count)
 
     def first_derivative_matrix(
         self, prefactor: Union[float, complex] = 1.0, periodic: bool = False
@@ -15,7 +15,6 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Tuple
 
 import numpy as np
-import scipy as sp
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -392,21 +391,6 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
 
         return np.linalg.inv(Cmat) / 2.0
 
-    def _evals_calc(self, evals_count: int) -> ndarray:
-        hamiltonian_mat = self.hamiltonian()
-        evals = sp.linalg.eigh(
-            hamiltonian_mat, eigvals=(0, evals_count - 1), eigvals_only=True
-        )
-        return np.sort(evals)
-
-    def _esys_calc(self, evals_count: int) -> Tuple[ndarray, ndarray]:
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sp.linalg.eigh(
-            hamiltonian_mat, eigvals=(0, evals_count - 1), eigvals_only=False
-        )
-        evals, evecs = spec_utils.order_eigensystem(evals, evecs)
-        return evals, evecs
-
     def hilbertdim(self) -> int:
         """Return Hilbert space dimension."""
         return (2 * self.ncut + 1) ** 2
@@ -13,7 +13,7 @@ import cmath
 import math
 import os
 
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import scipy as sp
@@ -63,6 +63,8 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
     EL = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     flux = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     cutoff = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    # the harmonic-oscillator basis functions are real-valued
+    _wavefunction_dtype = np.float_
 
     def __init__(
         self,
@@ -192,18 +194,44 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
         argument = alpha * self.phi_operator() + beta * np.eye(self.hilbertdim())
         return sp.linalg.sinm(argument)
 
-    def hamiltonian(self) -> ndarray:  # follow Zhu et al., PRB 87, 024510 (2013)
-        """Construct Hamiltonian matrix in harmonic-oscillator basis, following Zhu
-        et al., PRB 87, 024510 (2013)"""
+    def _lc_osc_matrix(self) -> ndarray:
         dimension = self.hilbertdim()
         diag_elements = [(i + 0.5) * self.E_plasma() for i in range(dimension)]
-        lc_osc_matrix = np.diag(diag_elements)
+        return np.diag(diag_elements)
 
+    def hamiltonian(self) -> ndarray:  # follow Zhu et al., PRB 87, 024510 (2013)
+        """Construct Hamiltonian matrix in harmonic-oscillator basis, following Zhu
+        et al., PRB 87, 024510 (2013)"""
+        lc_osc_matrix = self._lc_osc_matrix()
         cos_matrix = self.cos_phi_operator(beta=2 * np.pi * self.flux)
 
         hamiltonian_mat = lc_osc_matrix - self.EJ * cos_matrix
         return hamiltonian_mat
 
+    def _hamiltonian_components(
+        self, param_name: str
+    ) -> Optional[base.HamiltonianComponents]:
+        if param_name == "EJ":
+            cos_matrix = self.cos_phi_operator(beta=2 * np.pi * self.flux)
+            return self._lc_osc_matrix(), [(lambda EJ: -EJ, cos_matrix)]
+        if param_name == "flux":
+            # cos(phi + 2 pi flux) = cos(phi) cos(2 pi flux) - sin(phi) sin(2 pi flux)
+            EJ = self.EJ
+            return (
+                self._lc_osc_matrix(),
+                [
+                    (
+                        lambda flux: -EJ * np.cos(2 * np.pi * flux),
+                        self.cos_phi_operator(),
+                    ),
+                    (
+                        lambda flux: EJ * np.sin(2 * np.pi * flux),
+                        self.sin_phi_operator(),
+                    ),
+                ],
+            )
+        return None
+
     def d_hamiltonian_d_EJ(self) -> ndarray:
         """Returns operator representing a derivative of the Hamiltonian with respect
         to `EJ`.
@@ -278,3 +306,22 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
             amplitudes=phi_wavefunc_amplitudes,
             energy=evals[which],
         )
+
+    def _wavefunctions_bulk(
+        self,
+        esys: Tuple[ndarray, ndarray],
+        wavefunc_indices: Sequence[int],
+        phi_grid: "Grid1d",
+        out: Optional[ndarray] = None,
+    ) -> ndarray:
+        _, evecs = esys
+        phi_basis_labels = phi_grid.make_linspace()
+        phi_osc = self.phi_osc()
+        # harmonic oscillator basis functions, evaluated on the grid
+        basis_vals = np.asarray(
+            [
+                osc.harm_osc_wavefunction(n, phi_basis_labels, phi_osc)
+                for n in range(self.hilbertdim())
+            ]
+        )
+        return np.matmul(evecs[:, list(wavefunc_indices)].T, basis_vals, out=out)
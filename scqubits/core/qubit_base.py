@@ -12,11 +12,20 @@
 Provides the base classes for qubits
 """
 
+import contextlib
+import copy
 import functools
+import hashlib
 import inspect
+import os
+import tempfile
+import zipfile
 
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Number
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -25,6 +34,7 @@ import scipy as sp
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from numpy import ndarray
+from scipy import sparse
 
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
@@ -35,15 +45,14 @@ import scqubits.utils.plotting as plot
 
 from scqubits.core.central_dispatch import DispatchClient
 from scqubits.core.discretization import Grid1d
-from scqubits.core.storage import DataStore, SpectrumData
+from scqubits.core.storage import DataStore, SpectrumData, WaveFunctionBatch
 from scqubits.settings import IN_IPYTHON
-from scqubits.utils.cpu_switch import get_map_method
-from scqubits.utils.misc import InfoBar, process_which
+from scqubits.utils.cpu_switch import get_map_method, limit_blas_threads
+from scqubits.utils.misc import InfoBar, Required, process_which
 from scqubits.utils.spectrum_utils import (
     get_matrixelement_table,
     order_eigensystem,
-    recast_esys_mapdata,
-    standardize_sign,
+    standardize_sign_batch,
 )
 
 if IN_IPYTHON:
@@ -51,6 +60,22 @@ if IN_IPYTHON:
 else:
     from tqdm import tqdm
 
+try:
+    from scqubits.version import version as _SCQUBITS_VERSION
+except ImportError:
+    _SCQUBITS_VERSION = None
+
+try:
+    import cupy as cp
+except ImportError:
+    _HAS_CUPY = False
+else:
+    _HAS_CUPY = True
+
+# Decomposition of a Hamiltonian with respect to one parameter, see
+# `QubitBaseClass._hamiltonian_components`
+HamiltonianComponents = Tuple[ndarray, List[Tuple[Callable[[float], float], ndarray]]]
+
 
 # —Generic quantum system container and Qubit base class——————————————————————————————
 
@@ -116,7 +141,19 @@ class QuantumSystem(DispatchClient, ABC):
     def __eq__(self, other: Any):
         if not isinstance(other, type(self)):
             return False
-        return self.__dict__ == other.__dict__
+        return self._state_dict() == other._state_dict()
+
+    def _state_dict(self) -> Dict[str, Any]:
+        """Returns the instance `__dict__` without cached data."""
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name != "_eigen_cache"
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # cached eigendata is not to be passed along, e.g., to worker processes
+        return self._state_dict()
 
     def __hash__(self):
         return super().__hash__()
@@ -180,22 +217,298 @@ class QubitBaseClass(QuantumSystem, ABC):
     _evec_dtype: type
     _sys_type: str
     _init_params: list
+    # number of nonzero subdiagonals of the (dense) Hamiltonian matrix if it is
+    # banded, None otherwise; enables use of the banded eigensolver
+    _hamiltonian_bandwidth: Optional[int] = None
+    # results of recent parameter sweeps, shared among all instances and keyed by
+    # `_sweep_cache_key`
+    _sweep_cache: "OrderedDict[Tuple, SpectrumData]" = OrderedDict()
 
     @abstractmethod
     def hamiltonian(self):
         """Returns the Hamiltonian"""
 
-    def _evals_calc(self, evals_count: int) -> ndarray:
-        hamiltonian_mat = self.hamiltonian()
+    def _hamiltonian_components(
+        self, param_name: str
+    ) -> Optional[HamiltonianComponents]:
+        """Decomposes the Hamiltonian with respect to its dependence on the
+        parameter `param_name`, all other parameters held fixed at their current
+        values. Returns `(hamiltonian_const, coefficient_terms)` with
+        `coefficient_terms` a list of tuples `(coefficient_func, matrix)`, such that
+        the Hamiltonian is given by::
+
+            hamiltonian_const + sum(coefficient_func(paramval) * matrix)
+
+        Subclasses may override this to enable parameter sweeps that avoid
+        re-assembling the Hamiltonian from scratch at every parameter value. The
+        default is `None`, signaling that no such decomposition is available.
+
+        Parameters
+        ----------
+        param_name:
+            name of the parameter the Hamiltonian is to be decomposed for
+        """
+        return None
+
+    @staticmethod
+    def _hamiltonian_from_components(
+        hamiltonian_components: HamiltonianComponents,
+        paramval: float,
+        buffers: Optional[Tuple[ndarray, ndarray]] = None,
+    ) -> ndarray:
+        """Assembles the Hamiltonian for parameter value `paramval` from the
+        decomposition provided by `_hamiltonian_components`.
+
+        Parameters
+        ----------
+        hamiltonian_components:
+            decomposition of the Hamiltonian, see `_hamiltonian_components`
+        paramval:
+            parameter value
+        buffers:
+            if given, pair of arrays obtained from `_hamiltonian_buffers`; the
+            Hamiltonian is then written into the first one without any allocation
+            (the second one is used as scratch space)
+        """
+        hamiltonian_mat, coefficient_terms = hamiltonian_components
+        if buffers is None:
+            for coefficient_func, matrix in coefficient_terms:
+                hamiltonian_mat = hamiltonian_mat + coefficient_func(paramval) * matrix
+            return hamiltonian_mat
+
+        hamiltonian_buffer, scratch_buffer = buffers
+        np.copyto(hamiltonian_buffer, hamiltonian_mat)
+        for coefficient_func, matrix in coefficient_terms:
+            np.multiply(matrix, coefficient_func(paramval), out=scratch_buffer)
+            hamiltonian_buffer += scratch_buffer
+        return hamiltonian_buffer
+
+    @staticmethod
+    def _hamiltonian_buffers(
+        hamiltonian_components: HamiltonianComponents,
+    ) -> Optional[Tuple[ndarray, ndarray]]:
+        """Returns buffers for repeated assembly of dense Hamiltonians by
+        `_hamiltonian_from_components`, or None for sparse Hamiltonians. Buffers are
+        Fortran-ordered so that LAPACK can overwrite them in place rather than
+        working on a copy."""
+        hamiltonian_const, coefficient_terms = hamiltonian_components
+        matrices = [hamiltonian_const] + [matrix for _, matrix in coefficient_terms]
+        if not all(isinstance(matrix, ndarray) for matrix in matrices):
+            return None
+        dtype = np.result_type(*matrices)
+        return (
+            np.empty(hamiltonian_const.shape, dtype=dtype, order="F"),
+            np.empty(hamiltonian_const.shape, dtype=dtype, order="F"),
+        )
+
+    def broadcast(self, event: str, **kwargs) -> None:
+        # Every change of a watched parameter triggers a broadcast. Such changes
+        # also alter the keys of cached eigendata; clearing the cache here covers
+        # changes not reflected in the parameter fingerprint.
+        self.__dict__.pop("_eigen_cache", None)
+        super().broadcast(event, **kwargs)
+
+    def _cached_eigendata(
+        self, kind: str, evals_count: int, calc_func: Callable[[int], Any]
+    ) -> Any:
+        """Returns `calc_func(evals_count)`, reusing the result of an earlier call
+        for identical qubit parameters. The most recent `settings.EIGEN_CACHE_SIZE`
+        results are kept, keyed by the parameter fingerprint of the qubit. Copies
+        are returned so that cached data cannot be modified by the caller.
+
+        Parameters
+        ----------
+        kind:
+            label distinguishing the cached quantity, e.g. "evals" or "esys"
+        evals_count:
+            number of desired eigenvalues/eigenstates
+        calc_func:
+            method computing the eigendata
+        """
+        if settings.EIGEN_CACHE_SIZE <= 0:
+            return calc_func(evals_count)
+        cache = self.__dict__.setdefault("_eigen_cache", OrderedDict())
+        key = (self._parameter_fingerprint(), kind, evals_count)
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = calc_func(evals_count)
+            while len(cache) > settings.EIGEN_CACHE_SIZE:
+                cache.popitem(last=False)
+        return copy.deepcopy(cache[key])
+
+    @staticmethod
+    def _use_full_spectrum(evals_count: int, dimension: int) -> bool:
+        """Decide whether it is cheaper to compute the full spectrum (divide-and-
+        conquer driver) and slice it, rather than computing only the requested
+        subset of eigenvalues."""
+        return evals_count > settings.EVD_FRACTION_THRESHOLD * dimension
+
+    @staticmethod
+    def _use_sparse_solver(hamiltonian_mat: ndarray, evals_count: int) -> bool:
+        """Decide whether the dense `hamiltonian_mat` is sparse enough, and the
+        number of requested eigenvalues small enough, for shift-invert Lanczos
+        to beat dense diagonalization."""
+        dimension = hamiltonian_mat.shape[0]
+        if dimension < settings.SPARSE_EIGSH_MIN_DIMENSION:
+            return False
+        if evals_count >= settings.SPARSE_EIGSH_MAX_FRACTION * dimension:
+            return False
+        nonzero_count = np.count_nonzero(hamiltonian_mat)
+        return nonzero_count <= settings.SPARSE_EIGSH_MAX_DENSITY * dimension ** 2
+
+    @staticmethod
+    def _spectrum_lower_bound(hamiltonian_mat: ndarray) -> float:
+        """Returns a value slightly below the lowest eigenvalue of the Hermitian
+        `hamiltonian_mat`, based on Gershgorin's circle theorem. Used as shift in
+        shift-invert Lanczos, so that the eigenvalues closest to the shift are the
+        lowest ones."""
+        diagonal = np.diagonal(hamiltonian_mat)
+        radii = np.sum(np.abs(hamiltonian_mat), axis=1) - np.abs(diagonal)
+        bound = np.min(diagonal.real - radii)
+        # stay clear of the spectrum to keep the shifted matrix non-singular
+        return bound - 1.0e-3 * (1.0 + abs(bound))
+
+    def _sparse_eigsh(
+        self, hamiltonian_mat: ndarray, evals_count: int, eigvals_only: bool
+    ) -> Union[ndarray, Tuple[ndarray, ndarray]]:
+        """Lowest eigenvalues (and eigenvectors) of the dense `hamiltonian_mat`,
+        obtained by shift-invert Lanczos on its sparse representation."""
+        result = sparse.linalg.eigsh(
+            sparse.csc_matrix(hamiltonian_mat),
+            k=evals_count,
+            sigma=self._spectrum_lower_bound(hamiltonian_mat),
+            which="LM",
+            return_eigenvectors=not eigvals_only,
+            v0=settings.RANDOM_ARRAY[: hamiltonian_mat.shape[0]],
+        )
+        if eigvals_only:
+            return np.sort(result)
+        return order_eigensystem(*result)
+
+    @staticmethod
+    def _use_gpu(dimension: int) -> bool:
+        """Decide whether a dense Hamiltonian of the given dimension is to be
+        diagonalized on the GPU, see `settings.USE_GPU`."""
+        return settings.USE_GPU and dimension >= settings.GPU_EIGH_MIN_DIMENSION
+
+    @staticmethod
+    @Required(cupy=_HAS_CUPY)
+    def _gpu_eigh(
+        hamiltonian_mat: ndarray, evals_count: int, eigvals_only: bool
+    ) -> Union[ndarray, Tuple[ndarray, ndarray]]:
+        """Diagonalizes `hamiltonian_mat` on the GPU with CuPy, copying only the
+        lowest `evals_count` eigenvalues (and eigenvectors) back to the host."""
+        hamiltonian_gpu = cp.asarray(hamiltonian_mat)
+        if eigvals_only:
+            return cp.linalg.eigvalsh(hamiltonian_gpu)[:evals_count].get()
+        evals, evecs = cp.linalg.eigh(hamiltonian_gpu)
+        return evals[:evals_count].get(), evecs[:, :evals_count].get()
+
+    @staticmethod
+    def _banded_form(hamiltonian_mat: ndarray, bandwidth: int) -> ndarray:
+        """Returns the lower banded storage of `hamiltonian_mat` expected by
+        `scipy.linalg.eig_banded`: row k holds the k-th subdiagonal."""
+        dimension = hamiltonian_mat.shape[0]
+        banded_mat = np.zeros((bandwidth + 1, dimension), dtype=hamiltonian_mat.dtype)
+        for offset in range(bandwidth + 1):
+            banded_mat[offset, : dimension - offset] = np.diagonal(
+                hamiltonian_mat, -offset
+            )
+        return banded_mat
+
+    def _evals_calc(
+        self, evals_count: int, hamiltonian_mat: Optional[ndarray] = None
+    ) -> ndarray:
+        if hamiltonian_mat is None:
+            hamiltonian_mat = self.hamiltonian()
+        if sparse.issparse(hamiltonian_mat):
+            # shift-invert Lanczos: only the lowest `evals_count` eigenvalues needed
+            evals = sparse.linalg.eigsh(
+                hamiltonian_mat,
+                k=evals_count,
+                sigma=0.0,
+                which="LM",
+                return_eigenvectors=False,
+                v0=settings.RANDOM_ARRAY[: hamiltonian_mat.shape[0]],
+            )
+            return np.sort(evals)
+        if self._hamiltonian_bandwidth is not None:
+            return sp.linalg.eig_banded(
+                self._banded_form(hamiltonian_mat, self._hamiltonian_bandwidth),
+                lower=True,
+                eigvals_only=True,
+                select="i",
+                select_range=(0, evals_count - 1),
+                check_finite=False,
+            )
+        if self._use_sparse_solver(hamiltonian_mat, evals_count):
+            return self._sparse_eigsh(hamiltonian_mat, evals_count, eigvals_only=True)
+        if self._use_gpu(hamiltonian_mat.shape[0]):
+            return self._gpu_eigh(hamiltonian_mat, evals_count, eigvals_only=True)
+        if self._use_full_spectrum(evals_count, hamiltonian_mat.shape[0]):
+            evals = sp.linalg.eigh(
+                hamiltonian_mat,
+                eigvals_only=True,
+                driver="evd",
+                check_finite=False,
+                overwrite_a=True,
+            )
+            return evals[:evals_count]
         evals = sp.linalg.eigh(
-            hamiltonian_mat, eigvals_only=True, eigvals=(0, evals_count - 1)
+            hamiltonian_mat,
+            eigvals_only=True,
+            subset_by_index=(0, evals_count - 1),
+            driver="evr",
+            check_finite=False,
+            overwrite_a=True,
         )
         return np.sort(evals)
 
-    def _esys_calc(self, evals_count: int) -> Tuple[ndarray, ndarray]:
-        hamiltonian_mat = self.hamiltonian()
+    def _esys_calc(
+        self, evals_count: int, hamiltonian_mat: Optional[ndarray] = None
+    ) -> Tuple[ndarray, ndarray]:
+        if hamiltonian_mat is None:
+            hamiltonian_mat = self.hamiltonian()
+        if sparse.issparse(hamiltonian_mat):
+            evals, evecs = sparse.linalg.eigsh(
+                hamiltonian_mat,
+                k=evals_count,
+                sigma=0.0,
+                which="LM",
+                return_eigenvectors=True,
+                v0=settings.RANDOM_ARRAY[: hamiltonian_mat.shape[0]],
+            )
+            return order_eigensystem(evals, evecs)
+        if self._hamiltonian_bandwidth is not None:
+            return sp.linalg.eig_banded(
+                self._banded_form(hamiltonian_mat, self._hamiltonian_bandwidth),
+                lower=True,
+                select="i",
+                select_range=(0, evals_count - 1),
+                check_finite=False,
+            )
+        if self._use_sparse_solver(hamiltonian_mat, evals_count):
+            return self._sparse_eigsh(hamiltonian_mat, evals_count, eigvals_only=False)
+        if self._use_gpu(hamiltonian_mat.shape[0]):
+            return self._gpu_eigh(hamiltonian_mat, evals_count, eigvals_only=False)
+        if self._use_full_spectrum(evals_count, hamiltonian_mat.shape[0]):
+            evals, evecs = sp.linalg.eigh(
+                hamiltonian_mat,
+                eigvals_only=False,
+                driver="evd",
+                check_finite=False,
+                overwrite_a=True,
+            )
+            # copy to avoid holding on to the memory of the full eigenvector matrix
+            return evals[:evals_count], evecs[:, :evals_count].copy()
         evals, evecs = sp.linalg.eigh(
-            hamiltonian_mat, eigvals_only=False, eigvals=(0, evals_count - 1)
+            hamiltonian_mat,
+            eigvals_only=False,
+            subset_by_index=(0, evals_count - 1),
+            driver="evr",
+            check_finite=False,
+            overwrite_a=True,
         )
         evals, evecs = order_eigensystem(evals, evecs)
         return evals, evecs
@@ -224,7 +537,7 @@ class QubitBaseClass(QuantumSystem, ABC):
         -------
             eigenvalues as ndarray or in form of a SpectrumData object
         """
-        evals = self._evals_calc(evals_count)
+        evals = self._cached_eigendata("evals", evals_count, self._evals_calc)
         if filename or return_spectrumdata:
             specdata = SpectrumData(
                 energy_table=evals, system_params=self.get_initdata()
@@ -258,7 +571,7 @@ class QubitBaseClass(QuantumSystem, ABC):
         -------
             eigenvalues, eigenvectors as numpy arrays or in form of a SpectrumData object
         """
-        evals, evecs = self._esys_calc(evals_count)
+        evals, evecs = self._cached_eigendata("esys", evals_count, self._esys_calc)
         if filename or return_spectrumdata:
             specdata = SpectrumData(
                 energy_table=evals, system_params=self.get_initdata(), state_table=evecs
@@ -311,16 +624,269 @@ class QubitBaseClass(QuantumSystem, ABC):
         return data_store if return_datastore else table
 
     def _esys_for_paramval(
-        self, paramval: float, param_name: str, evals_count: int
+        self,
+        paramval: float,
+        param_name: str,
+        evals_count: int,
+        hamiltonian_components: Optional[HamiltonianComponents] = None,
+        hamiltonian_buffers: Optional[Tuple[ndarray, ndarray]] = None,
+        blas_threads: Optional[int] = None,
     ) -> Union[Tuple[ndarray, ndarray], SpectrumData]:
+        if hamiltonian_components is not None:
+            hamiltonian_mat = self._hamiltonian_from_components(
+                hamiltonian_components, paramval, buffers=hamiltonian_buffers
+            )
+            return self._esys_calc(evals_count, hamiltonian_mat=hamiltonian_mat)
         setattr(self, param_name, paramval)
-        return self.eigensys(evals_count)
+        with limit_blas_threads(blas_threads):
+            return self.eigensys(evals_count)
 
     def _evals_for_paramval(
-        self, paramval: float, param_name: str, evals_count: int
+        self,
+        paramval: float,
+        param_name: str,
+        evals_count: int,
+        hamiltonian_components: Optional[HamiltonianComponents] = None,
+        hamiltonian_buffers: Optional[Tuple[ndarray, ndarray]] = None,
+        blas_threads: Optional[int] = None,
     ) -> ndarray:
+        if hamiltonian_components is not None:
+            hamiltonian_mat = self._hamiltonian_from_components(
+                hamiltonian_components, paramval, buffers=hamiltonian_buffers
+            )
+            return self._evals_calc(evals_count, hamiltonian_mat=hamiltonian_mat)
         setattr(self, param_name, paramval)
-        return self.eigenvals(evals_count)
+        with limit_blas_threads(blas_threads):
+            return self.eigenvals(evals_count)
+
+    def _parameter_fingerprint(self) -> Tuple:
+        """Returns a hashable snapshot of the parameters (`__init__` arguments)
+        defining the qubit."""
+        fingerprint: List[Any] = [type(self).__name__]
+        for name in self._init_params:
+            value = getattr(self, name)
+            if isinstance(value, ndarray):
+                value = (value.dtype.str, value.shape, value.tobytes())
+            elif not isinstance(value, (Number, str, type(None))):
+                value = repr(value)
+            fingerprint.append((name, value))
+        return tuple(fingerprint)
+
+    def _sweep_cache_key(
+        self,
+        param_name: str,
+        param_vals: ndarray,
+        evals_count: int,
+        subtract_ground: bool,
+        get_eigenstates: bool,
+    ) -> Tuple:
+        # the scqubits version is part of the key, so that sweep files stored on
+        # disk by a different version are not reused
+        return (
+            _SCQUBITS_VERSION,
+            self._parameter_fingerprint(),
+            param_name,
+            np.asarray(param_vals, dtype=np.float_).tobytes(),
+            evals_count,
+            subtract_ground,
+            get_eigenstates,
+        )
+
+    @staticmethod
+    def _sweep_cache_filename(sweep_key: Tuple) -> str:
+        digest = hashlib.sha1(repr(sweep_key).encode()).hexdigest()
+        return os.path.join(settings.SWEEP_CACHE_DIR, "sweep_{}.npz".format(digest))
+
+    @staticmethod
+    def _copy_specdata(specdata: SpectrumData) -> SpectrumData:
+        return SpectrumData(
+            specdata.energy_table.copy(),
+            dict(specdata.system_params),
+            specdata.param_name,
+            np.array(specdata.param_vals),
+            state_table=copy.deepcopy(specdata.state_table),
+        )
+
+    def _cached_sweep(self, sweep_key: Tuple) -> Optional[SpectrumData]:
+        """Returns a copy of the sweep result stored under `sweep_key` in memory or
+        in `settings.SWEEP_CACHE_DIR`, or None if there is none."""
+        if sweep_key in self._sweep_cache:
+            self._sweep_cache.move_to_end(sweep_key)
+            return self._copy_specdata(self._sweep_cache[sweep_key])
+        if settings.SWEEP_CACHE_DIR is None:
+            return None
+        filename = self._sweep_cache_filename(sweep_key)
+        # also False for missing files
+        if not zipfile.is_zipfile(filename):
+            return None
+        try:
+            with np.load(filename) as sweep_file:
+                state_table = (
+                    list(sweep_file["state_table"])
+                    if "state_table" in sweep_file
+                    else None
+                )
+                specdata = SpectrumData(
+                    sweep_file["energy_table"],
+                    self.get_initdata(),
+                    sweep_key[2],
+                    sweep_file["param_vals"],
+                    state_table=state_table,
+                )
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+            # unreadable (e.g., truncated) files are treated as a cache miss
+            return None
+        self._store_sweep(sweep_key, specdata, write_file=False)
+        return self._copy_specdata(specdata)
+
+    def _store_sweep(
+        self, sweep_key: Tuple, specdata: SpectrumData, write_file: bool = True
+    ) -> None:
+        """Records a sweep result in the in-memory cache (limited to the
+        `settings.SWEEP_CACHE_SIZE` most recent sweeps) and, if
+        `settings.SWEEP_CACHE_DIR` is set, on disk. Sweeps with eigenstate tables
+        larger than `settings.SWEEP_CACHE_MAX_STATE_BYTES` are not cached, since
+        caching requires a copy of the table."""
+        if specdata.state_table is not None and (
+            isinstance(specdata.state_table, np.memmap)
+            or sum(evecs.nbytes for evecs in specdata.state_table)
+            > settings.SWEEP_CACHE_MAX_STATE_BYTES
+        ):
+            return
+        if settings.SWEEP_CACHE_SIZE > 0:
+            self._sweep_cache[sweep_key] = self._copy_specdata(specdata)
+            while len(self._sweep_cache) > settings.SWEEP_CACHE_SIZE:
+                self._sweep_cache.popitem(last=False)
+        if not write_file or settings.SWEEP_CACHE_DIR is None:
+            return
+        arrays = {
+            "energy_table": specdata.energy_table,
+            "param_vals": np.asarray(specdata.param_vals),
+        }
+        if specdata.state_table is not None:
+            if len({evecs.shape for evecs in specdata.state_table}) != 1:
+                return  # eigenvectors of varying dimension are not stored
+            arrays["state_table"] = np.asarray(specdata.state_table)
+        os.makedirs(settings.SWEEP_CACHE_DIR, exist_ok=True)
+        # The file is written under a temporary name and then moved into place, so
+        # that an interrupted or concurrent write never leaves a truncated file
+        # under the final name.
+        file_descriptor, temp_filename = tempfile.mkstemp(
+            suffix=".tmp", dir=settings.SWEEP_CACHE_DIR
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                np.savez(temp_file, **arrays)
+            os.replace(temp_filename, self._sweep_cache_filename(sweep_key))
+        finally:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+
+    @staticmethod
+    def _add_to_state_table(
+        state_table: Optional[Union[List[ndarray], np.memmap]],
+        index: int,
+        evecs: ndarray,
+        paramvals_count: int,
+    ) -> Union[List[ndarray], np.memmap]:
+        """Stores `evecs` as entry `index` of the eigenstate table of a sweep and
+        returns the table (start with `state_table=None`). If the table would exceed
+        `settings.STATE_TABLE_MEMMAP_BYTES`, it is backed by a temporary file via
+        `np.memmap`, so that only the currently used parts reside in memory.
+
+        Note that it is useful here that the outermost eigenstate object is a list
+        otherwise, as for certain applications the necessary hilbert space dimension
+        can vary with paramvals. A memmap table is converted to a list as soon as
+        eigenvectors of differing shape or dtype are encountered.
+        """
+        if state_table is None:
+            state_table = []
+            max_bytes = settings.STATE_TABLE_MEMMAP_BYTES
+            if max_bytes is not None and paramvals_count * evecs.nbytes > max_bytes:
+                state_table = np.memmap(
+                    tempfile.TemporaryFile(prefix="scqubits_"),
+                    dtype=evecs.dtype,
+                    mode="w+",
+                    shape=(paramvals_count,) + evecs.shape,
+                )
+        if isinstance(state_table, np.memmap) and (
+            evecs.shape != state_table.shape[1:]
+            or not np.can_cast(evecs.dtype, state_table.dtype)
+        ):
+            state_table = list(state_table[:index])
+        if isinstance(state_table, list):
+            state_table.append(evecs)
+        else:
+            state_table[index] = evecs
+        return state_table
+
+    @staticmethod
+    def _batched_eigh_applicable(
+        hamiltonian_components: Optional[HamiltonianComponents], num_cpus: int
+    ) -> bool:
+        """Returns True if the sweep can be diagonalized in batches of stacked dense
+        Hamiltonians: this requires a Hamiltonian decomposition, dense matrices of
+        small dimension, and serial execution."""
+        if hamiltonian_components is None or num_cpus > 1:
+            return False
+        hamiltonian_const, coefficient_terms = hamiltonian_components
+        matrices = [hamiltonian_const] + [matrix for _, matrix in coefficient_terms]
+        return (
+            all(isinstance(matrix, ndarray) for matrix in matrices)
+            and hamiltonian_const.shape[0] <= settings.BATCHED_EIGH_MAX_DIMENSION
+        )
+
+    def _batched_esys_for_paramvals(
+        self,
+        param_vals: ndarray,
+        evals_count: int,
+        hamiltonian_components: HamiltonianComponents,
+        get_eigenstates: bool,
+    ) -> Tuple[ndarray, Optional[Union[List[ndarray], np.memmap]]]:
+        """Diagonalizes the Hamiltonians for all parameter values by passing stacks
+        of matrices to `np.linalg.eigh`, which loops over them inside LAPACK. The
+        number of matrices per stack is limited by `settings.BATCHED_EIGH_MAX_BYTES`.
+
+        Returns
+        -------
+            eigenvalue table and, if `get_eigenstates` is True, eigenstate table as
+            obtained from `_add_to_state_table` (else None)
+        """
+        hamiltonian_const, parameter_terms = hamiltonian_components
+        matrix_dtype = np.result_type(
+            hamiltonian_const, *[matrix for _, matrix in parameter_terms]
+        )
+        batch_size = max(
+            1,
+            settings.BATCHED_EIGH_MAX_BYTES
+            // (hamiltonian_const.size * matrix_dtype.itemsize),
+        )
+        evals_batches = []
+        eigenstate_table = None
+        for start in range(0, len(param_vals), batch_size):
+            batch_vals = param_vals[start : start + batch_size]
+            hamiltonian_stack = np.broadcast_to(
+                hamiltonian_const, (len(batch_vals),) + hamiltonian_const.shape
+            ).astype(matrix_dtype)
+            for coefficient_func, matrix in parameter_terms:
+                coefficients = np.asarray(
+                    [coefficient_func(paramval) for paramval in batch_vals]
+                )
+                hamiltonian_stack += coefficients[:, None, None] * matrix
+            if get_eigenstates:
+                evals, evecs = np.linalg.eigh(hamiltonian_stack)
+                for index, evecs_entry in enumerate(evecs, start):
+                    eigenstate_table = self._add_to_state_table(
+                        eigenstate_table,
+                        index,
+                        evecs_entry[:, :evals_count].copy(),
+                        len(param_vals),
+                    )
+            else:
+                evals = np.linalg.eigvalsh(hamiltonian_stack)
+            evals_batches.append(evals[:, :evals_count])
+        eigenvalue_table = np.concatenate(evals_batches)
+        return eigenvalue_table, eigenstate_table
 
     def get_spectrum_vs_paramvals(
         self,
@@ -358,43 +924,106 @@ class QubitBaseClass(QuantumSystem, ABC):
             (default value: settings.NUM_CPUS)
         """
         num_cpus = num_cpus or settings.NUM_CPUS
+        sweep_key = self._sweep_cache_key(
+            param_name, param_vals, evals_count, subtract_ground, get_eigenstates
+        )
+        specdata = self._cached_sweep(sweep_key)
+        if specdata is not None:
+            if filename:
+                specdata.filewrite(filename)
+            return specdata
+
+        specdata = self._compute_spectrum_vs_paramvals(
+            param_name,
+            param_vals,
+            evals_count,
+            subtract_ground,
+            get_eigenstates,
+            num_cpus,
+        )
+        self._store_sweep(sweep_key, specdata)
+        if filename:
+            specdata.filewrite(filename)
+        return specdata
+
+    def _compute_spectrum_vs_paramvals(
+        self,
+        param_name: str,
+        param_vals: ndarray,
+        evals_count: int,
+        subtract_ground: bool,
+        get_eigenstates: bool,
+        num_cpus: int,
+        show_progress: bool = True,
+        hamiltonian_components: Optional[HamiltonianComponents] = None,
+    ) -> SpectrumData:
+        """Carries out the sweep of `get_spectrum_vs_paramvals`, bypassing the
+        sweep cache. With `show_progress=False`, no progress bar is displayed
+        (e.g., for sweeps that are part of a larger computation). A decomposition
+        `hamiltonian_components` of the Hamiltonian with respect to `param_name`
+        may be passed if already at hand."""
         previous_paramval = getattr(self, param_name)
-        tqdm_disable = num_cpus > 1 or settings.PROGRESSBAR_DISABLED
+        tqdm_disable = (
+            num_cpus > 1 or settings.PROGRESSBAR_DISABLED or not show_progress
+        )
 
-        target_map = get_map_method(num_cpus)
-        if not get_eigenstates:
-            func = functools.partial(
-                self._evals_for_paramval, param_name=param_name, evals_count=evals_count
+        # If available, the parameter-independent parts of the Hamiltonian are
+        # computed only once for the entire sweep.
+        if hamiltonian_components is None:
+            hamiltonian_components = self._hamiltonian_components(param_name)
+
+        # Worker processes do not inherit BLAS thread limits; without a Hamiltonian
+        # decomposition, these are imposed within each worker instead.
+        worker_blas_threads = (
+            1 if hamiltonian_components is None and num_cpus > 1 else None
+        )
+
+        if self._batched_eigh_applicable(hamiltonian_components, num_cpus):
+            eigenvalue_table, eigenstate_table = self._batched_esys_for_paramvals(
+                param_vals, evals_count, hamiltonian_components, get_eigenstates
             )
-            with InfoBar(
-                "Parallel computation of eigensystems [num_cpus={}]".format(num_cpus),
-                num_cpus,
-            ):
-                eigenvalue_table = list(
-                    target_map(
-                        func,
-                        tqdm(
-                            param_vals,
-                            desc="Spectral data",
-                            leave=False,
-                            disable=tqdm_disable,
-                        ),
-                    )
-                )
-            eigenvalue_table = np.asarray(eigenvalue_table)
-            eigenstate_table = None
         else:
+            # In serial computations, all Hamiltonians are assembled in the same
+            # memory.
+            hamiltonian_buffers = (
+                self._hamiltonian_buffers(hamiltonian_components)
+                if hamiltonian_components is not None and num_cpus == 1
+                else None
+            )
+            if get_eigenstates:
+                calc_func = self._esys_for_paramval
+                info_str = "Parallel computation of eigenvalues [num_cpus={}]"
+            else:
+                calc_func = self._evals_for_paramval
+                info_str = "Parallel computation of eigensystems [num_cpus={}]"
             func = functools.partial(
-                self._esys_for_paramval, param_name=param_name, evals_count=evals_count
+                calc_func,
+                param_name=param_name,
+                evals_count=evals_count,
+                hamiltonian_components=hamiltonian_components,
+                hamiltonian_buffers=hamiltonian_buffers,
+                blas_threads=worker_blas_threads,
             )
+            eigenvalue_table = np.empty((len(param_vals), evals_count))
+            eigenstate_table = None
             with InfoBar(
-                "Parallel computation of eigenvalues [num_cpus={}]".format(num_cpus),
-                num_cpus,
-            ):
-                # Note that it is useful here that the outermost eigenstate object is
-                # a list, as for certain applications the necessary hilbert space
-                # dimension can vary with paramvals
-                eigensystem_mapdata = list(
+                info_str.format(num_cpus), num_cpus
+            ), contextlib.ExitStack() as stack:
+                if hamiltonian_components is None:
+                    target_map = get_map_method(num_cpus)
+                elif num_cpus == 1:
+                    target_map = map
+                else:
+                    # Diagonalization then does not mutate `self` and can be shared
+                    # among threads; the number of BLAS threads is limited to avoid
+                    # oversubscription. Both the limit and the thread pool are
+                    # released when leaving the `with` block.
+                    stack.enter_context(limit_blas_threads(1))
+                    executor = stack.enter_context(
+                        ThreadPoolExecutor(max_workers=num_cpus)
+                    )
+                    target_map = executor.map
+                for index, result in enumerate(
                     target_map(
                         func,
                         tqdm(
@@ -404,26 +1033,20 @@ class QubitBaseClass(QuantumSystem, ABC):
                             disable=tqdm_disable,
                         ),
                     )
-                )
-            eigenvalue_table, eigenstate_table = recast_esys_mapdata(
-                eigensystem_mapdata
-            )
+                ):
+                    if get_eigenstates:
+                        evals, evecs = result
+                        eigenstate_table = self._add_to_state_table(
+                            eigenstate_table, index, evecs, len(param_vals)
+                        )
+                    else:
+                        evals = result
+                    eigenvalue_table[index] = evals
 
         if subtract_ground:
-            for param_index, _ in enumerate(param_vals):
-                eigenvalue_table[param_index] -= eigenvalue_table[param_index][0]
+            eigenvalue_table -= eigenvalue_table[:, :1]
 
         setattr(self, param_name, previous_paramval)
-        specdata = SpectrumData(
-            eigenvalue_table,
-            self.get_initdata(),
-            param_name,
-            param_vals,
-            state_table=eigenstate_table,
-        )
-        if filename:
-            specdata.filewrite(filename)
-
         return SpectrumData(
             eigenvalue_table,
             self.get_initdata(),
@@ -432,6 +1055,41 @@ class QubitBaseClass(QuantumSystem, ABC):
             state_table=eigenstate_table,
         )
 
+    def _dispersion_energies_from_components(
+        self,
+        dispersion_name: str,
+        dispersion_vals: ndarray,
+        param_name: str,
+        param_vals: ndarray,
+        evals_count: int,
+        num_cpus: int,
+    ) -> Optional[ndarray]:
+        """Returns the eigenenergies for all combinations of `dispersion_vals` and
+        `param_vals`, indexed as `[dispersion_index, param_index, level]`. For each
+        value of `param_name`, the sweep over the dispersion parameter reuses the
+        parameter-independent parts of the Hamiltonian (see
+        `get_spectrum_vs_paramvals`); these intermediate sweeps are not cached and
+        show no progress bar. Returns None if the Hamiltonian has no decomposition
+        with respect to `dispersion_name`."""
+        eigenenergies_by_paramval = []
+        for paramval in param_vals:
+            setattr(self, param_name, paramval)
+            hamiltonian_components = self._hamiltonian_components(dispersion_name)
+            if hamiltonian_components is None:
+                return None
+            specdata = self._compute_spectrum_vs_paramvals(
+                dispersion_name,
+                dispersion_vals,
+                evals_count=evals_count,
+                subtract_ground=False,
+                get_eigenstates=False,
+                num_cpus=num_cpus,
+                show_progress=False,
+                hamiltonian_components=hamiltonian_components,
+            )
+            eigenenergies_by_paramval.append(specdata.energy_table)
+        return np.stack(eigenenergies_by_paramval, axis=1)
+
     def _compute_dispersion(
         self,
         dispersion_name: str,
@@ -444,42 +1102,50 @@ class QubitBaseClass(QuantumSystem, ABC):
     ) -> Tuple[ndarray, ndarray]:
         from scqubits import HilbertSpace, ParameterSweep
 
-        hilbertspace = HilbertSpace(subsystem_list=[self])
-
-        paramvals_by_name = {
-            dispersion_name: np.linspace(0.0, 1.0, point_count),
-            param_name: param_vals,
-        }
-
-        def update_func(disp_val, sweep_val):
-            setattr(self, dispersion_name, disp_val)
-            setattr(self, param_name, sweep_val)
-
         previous_dispval = getattr(self, dispersion_name)
         previous_paramval = getattr(self, param_name)
         max_level = np.max(transitions) if not levels else np.max(levels)
-        sweep = ParameterSweep(
-            hilbertspace,
-            paramvals_by_name,
-            update_func,
-            evals_count=max_level + 1,
-            bare_only=True,
-            num_cpus=num_cpus,
+        dispersion_vals = np.linspace(0.0, 1.0, point_count)
+
+        # As for the ParameterSweep below, (at least) `truncated_dim` levels are
+        # computed.
+        eigenenergies = self._dispersion_energies_from_components(
+            dispersion_name,
+            dispersion_vals,
+            param_name,
+            param_vals,
+            evals_count=max(self.truncated_dim, max_level + 1),
+            num_cpus=num_cpus or settings.NUM_CPUS,
         )
-        eigenenergies = sweep["bare_evals"]["subsys":0].toarray()
+        if eigenenergies is None:
+            hilbertspace = HilbertSpace(subsystem_list=[self])
+
+            paramvals_by_name = {
+                dispersion_name: dispersion_vals,
+                param_name: param_vals,
+            }
+
+            def update_func(disp_val, sweep_val):
+                setattr(self, dispersion_name, disp_val)
+                setattr(self, param_name, sweep_val)
+
+            sweep = ParameterSweep(
+                hilbertspace,
+                paramvals_by_name,
+                update_func,
+                evals_count=max_level + 1,
+                bare_only=True,
+                num_cpus=num_cpus,
+            )
+            eigenenergies = sweep["bare_evals"]["subsys":0].toarray()
 
+        # eigenenergies[dispersion_index, param_index, level]
         if levels is None:
-            dispersions = np.empty((len(transitions), len(param_vals)))
-            for index, (i, j) in enumerate(transitions):
-                energy_ij = eigenenergies[:, :, i] - eigenenergies[:, :, j]
-                dispersions[index] = np.max(energy_ij, axis=0) - np.min(
-                    energy_ij, axis=0
-                )
+            i_levels, j_levels = np.atleast_2d(transitions).T
+            energies = eigenenergies[:, :, i_levels] - eigenenergies[:, :, j_levels]
         else:
-            dispersions = np.empty((len(levels), len(param_vals)))
-            for index, j in enumerate(levels):
-                energy_j = eigenenergies[:, :, j]
-                dispersions[index] = np.max(energy_j, axis=0) - np.min(energy_j, axis=0)
+            energies = eigenenergies[:, :, list(levels)]
+        dispersions = np.ptp(energies, axis=0).T
 
         setattr(self, param_name, previous_paramval)
         setattr(self, dispersion_name, previous_dispval)
@@ -594,20 +1260,41 @@ class QubitBaseClass(QuantumSystem, ABC):
             num_cpus=num_cpus,
         )
         paramvals_count = len(param_vals)
-        matelem_table = np.empty(
-            shape=(paramvals_count, evals_count, evals_count), dtype=np.complex_
+        # parameter has been reset after the sweep: the operator matrix is the same
+        # for all eigenvectors below
+        operator_matrix = getattr(self, operator)()
+        state_table = spectrumdata.state_table
+        # matrix elements are real if both operator and eigenvectors are
+        matelem_dtype = np.result_type(
+            operator_matrix.dtype,
+            *{evecs.dtype for evecs in state_table},  # type: ignore
         )
 
-        for index, paramval in tqdm(
-            enumerate(param_vals),
-            total=len(param_vals),
-            disable=settings.PROGRESSBAR_DISABLED,
-            leave=False,
+        if isinstance(operator_matrix, ndarray) and (
+            len({evecs.shape for evecs in state_table}) == 1  # type: ignore
         ):
-            evecs = spectrumdata.state_table[index]  # type: ignore
-            matelem_table[index] = self.matrixelement_table(
-                operator, evecs=evecs, evals_count=evals_count
+            # dense operator, eigenvectors of equal shape: single contraction for
+            # all parameter values
+            evecs_stack = np.asarray(state_table)
+            if np.iscomplexobj(evecs_stack):
+                evecs_stack_dagger = evecs_stack.conj().transpose(0, 2, 1)
+            else:
+                evecs_stack_dagger = evecs_stack.transpose(0, 2, 1)
+            matelem_table = np.matmul(
+                evecs_stack_dagger, np.matmul(operator_matrix, evecs_stack)
+            ).astype(matelem_dtype, copy=False)
+        else:
+            matelem_table = np.empty(
+                shape=(paramvals_count, evals_count, evals_count), dtype=matelem_dtype
             )
+            for index, paramval in tqdm(
+                enumerate(param_vals),
+                total=len(param_vals),
+                disable=settings.PROGRESSBAR_DISABLED,
+                leave=False,
+            ):
+                evecs = state_table[index]  # type: ignore
+                matelem_table[index] = get_matrixelement_table(operator_matrix, evecs)
 
         spectrumdata.matrixelem_table = matelem_table
         return spectrumdata
@@ -851,6 +1538,12 @@ class QubitBaseClass(QuantumSystem, ABC):
 # —QubitBaseClass1d——————————————————————————————————————————————————————————————————
 
 
+@functools.lru_cache(maxsize=32)
+def _wavefunction1d_ylabel(mode: str, units_str: str) -> str:
+    ylabel = constants.MODE_STR_DICT[mode](r"$\psi_j(\varphi)$")
+    return ylabel + ",  energy [{}]".format(units_str)
+
+
 class QubitBaseClass1d(QubitBaseClass):
     """Base class for superconducting qubit objects with one degree of freedom.
     Provide general mechanisms and routines for plotting spectra, matrix elements,
@@ -860,6 +1553,10 @@ class QubitBaseClass1d(QubitBaseClass):
     # see PEP 526 https://www.python.org/dev/peps/pep-0526/#class-and-instance-variable-annotations
     _default_grid: Grid1d
     _evec_dtype = np.float_
+    # dtype of wave function amplitudes in the phase basis
+    _wavefunction_dtype = np.complex_
+    # precision of wave function amplitudes computed for plotting only
+    _plot_evec_dtype = np.float32
 
     @abstractmethod
     def potential(self, phi: Union[float, ndarray]) -> Union[float, ndarray]:
@@ -869,6 +1566,36 @@ class QubitBaseClass1d(QubitBaseClass):
     def wavefunction(self, esys: ndarray, which: int = 0, phi_grid: Grid1d = None):
         pass
 
+    def _wavefunctions_bulk(
+        self,
+        esys: Tuple[ndarray, ndarray],
+        wavefunc_indices: Sequence[int],
+        phi_grid: Grid1d,
+        out: Optional[ndarray] = None,
+    ) -> ndarray:
+        """Returns the amplitudes of the wave functions with indices
+        `wavefunc_indices` on `phi_grid`, as array of shape
+        (len(wavefunc_indices), phi_grid.pt_count). If given, the amplitudes are
+        written to the preallocated array `out` of that shape. Subclasses may
+        override this to obtain all amplitudes from a single matrix product with the
+        basis functions evaluated on the grid."""
+        if out is None:
+            out = np.empty(
+                (len(wavefunc_indices), phi_grid.pt_count),
+                dtype=self._wavefunctions_dtype(esys),
+            )
+        for row, index in enumerate(wavefunc_indices):
+            wavefunc = self.wavefunction(esys, which=index, phi_grid=phi_grid)
+            out[row] = wavefunc.amplitudes
+        return out
+
+    def _wavefunctions_dtype(self, esys: Tuple[ndarray, ndarray]) -> np.dtype:
+        """Returns the dtype of the phase-basis wave function amplitudes obtained
+        from `esys`. This is `_wavefunction_dtype`, unless complex eigenvectors are
+        given for real-valued basis functions."""
+        _, evecs = esys
+        return np.result_type(self._wavefunction_dtype, evecs)
+
     def wavefunction1d_defaults(
         self, mode: str, evals: ndarray, wavefunc_count: int
     ) -> Dict[str, Any]:
@@ -883,11 +1610,8 @@ class QubitBaseClass1d(QubitBaseClass):
         wavefunc_count:
             number of wave functions to be plotted
         """
-        ylabel = r"$\psi_j(\varphi)$"
-        ylabel = constants.MODE_STR_DICT[mode](ylabel)
-        ylabel += ",  energy [{}]".format(units.get_units())
-        options = {"xlabel": r"$\varphi$", "ylabel": ylabel}
-        return options
+        ylabel = _wavefunction1d_ylabel(mode, units.get_units())
+        return {"xlabel": r"$\varphi$", "ylabel": ylabel}
 
     def plot_wavefunction(
         self,
@@ -919,39 +1643,58 @@ class QubitBaseClass1d(QubitBaseClass):
         **kwargs:
             standard plotting option (see separate documentation)
         """
-        wavefunc_indices = process_which(which, self.truncated_dim)
+        wavefunc_indices = np.asarray(
+            process_which(which, self.truncated_dim), dtype=np.intp
+        )
 
         if esys is None:
-            evals_count = max(wavefunc_indices) + 1
-            evals = self.eigenvals(evals_count=evals_count)
-        else:
-            evals, _ = esys
+            evals_count = int(wavefunc_indices.max()) + 1
+            # diagonalize once here rather than in each `wavefunction` call below
+            esys = self.eigensys(evals_count=evals_count)
+        evals, _ = esys
 
-        energies = evals[list(wavefunc_indices)]
+        energies = np.take(evals, wavefunc_indices)
 
         phi_grid = phi_grid or self._default_grid
-        potential_vals = self.potential(phi_grid.make_linspace())
+        phi_basis_labels = phi_grid.make_linspace()
+        potential_vals = self.potential(phi_basis_labels)
 
         amplitude_modifier = constants.MODE_FUNC_DICT[mode]
-        wavefunctions = []
-        for wavefunc_index in wavefunc_indices:
-            phi_wavefunc = self.wavefunction(
-                esys, which=wavefunc_index, phi_grid=phi_grid
-            )
-            phi_wavefunc.amplitudes = standardize_sign(phi_wavefunc.amplitudes)
-            phi_wavefunc.amplitudes = amplitude_modifier(phi_wavefunc.amplitudes)
-            wavefunctions.append(phi_wavefunc)
+        if np.issubdtype(self._wavefunctions_dtype(esys), np.complexfloating):
+            plot_dtype = np.promote_types(self._plot_evec_dtype, np.complex64)
+        else:
+            plot_dtype = self._plot_evec_dtype
+        amplitudes = np.empty((len(wavefunc_indices), phi_grid.pt_count), plot_dtype)
+        self._wavefunctions_bulk(esys, wavefunc_indices, phi_grid, out=amplitudes)
+        if mode not in constants.SIGN_INVARIANT_MODES:
+            standardize_sign_batch(amplitudes)
+        # a single pass of the mode function over all wave functions; real-valued
+        # amplitudes are overwritten in place
+        if np.iscomplexobj(amplitudes):
+            modified_amplitudes = np.empty(amplitudes.shape, self._plot_evec_dtype)
+        else:
+            modified_amplitudes = amplitudes
+        amplitudes = amplitude_modifier(amplitudes, out=modified_amplitudes)
+        wavefunctions = WaveFunctionBatch(
+            basis_labels=phi_basis_labels, amplitudes=amplitudes, energies=energies
+        )
 
-        fig_ax = kwargs.get("fig_ax") or plt.subplots()
+        fig_ax = kwargs.get("fig_ax")
+        if fig_ax is None:
+            fig_ax = plt.subplots()
+        elif (
+            not isinstance(fig_ax, (tuple, list))
+            or len(fig_ax) != 2
+            or any(item is None for item in fig_ax)
+        ):
+            raise ValueError("fig_ax must be a tuple (Figure, Axes).")
         kwargs["fig_ax"] = fig_ax
-        kwargs = {
-            **self.wavefunction1d_defaults(
-                mode, evals, wavefunc_count=len(wavefunc_indices)
-            ),
-            **kwargs,
-        }
-        # in merging the dictionaries in the previous line: if any duplicates,
-        # later ones survive
+        # defaults only fill in options not explicitly given in kwargs
+        defaults = self.wavefunction1d_defaults(
+            mode, evals, wavefunc_count=len(wavefunc_indices)
+        )
+        for key, value in defaults.items():
+            kwargs.setdefault(key, value)
 
         plot.wavefunction1d(
             wavefunctions,
@@ -9,7 +9,7 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple, Union
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -49,6 +49,47 @@ class WaveFunction:
         self.energy = energy
 
 
+# —WaveFunctionBatch class——————————————————————————————————————————————————————————————————————————————————————————————
+
+
+class WaveFunctionBatch:
+    """Container for several wave functions defined for the same basis. The
+    amplitudes are stored in a single 2d array, one row per wave function. Indexing
+    and iteration yield the individual wave functions as `WaveFunction` objects whose
+    amplitudes are views of the rows.
+
+    Parameters
+    ----------
+    basis_labels:
+        labels of basis states; for example, in position basis: values of position variable
+    amplitudes:
+        wave function amplitudes, one row for each wave function
+    energies:
+        energies of the wave functions
+    """
+
+    def __init__(
+        self, basis_labels: ndarray, amplitudes: ndarray, energies: ndarray = None
+    ) -> None:
+        self.basis_labels = basis_labels
+        self.amplitudes = amplitudes
+        self.energies = energies
+
+    def __len__(self) -> int:
+        return len(self.amplitudes)
+
+    def __getitem__(self, index: int) -> WaveFunction:
+        return WaveFunction(
+            basis_labels=self.basis_labels,
+            amplitudes=self.amplitudes[index],
+            energy=None if self.energies is None else self.energies[index],
+        )
+
+    def __iter__(self) -> Iterator[WaveFunction]:
+        for index in range(len(self)):
+            yield self[index]
+
+
 # —WaveFunctionOnGrid class—————————————————————————————————————————————————————————————————————————————————————————————
 
 
@@ -9,10 +9,11 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import functools
 import math
 import os
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -61,6 +62,8 @@ class Transmon(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
     EC = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ng = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ncut = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    # the Hamiltonian in the charge basis is tridiagonal
+    _hamiltonian_bandwidth = 1
 
     def __init__(
         self, EJ: float, EC: float, ng: float, ncut: int, truncated_dim: int = 6
@@ -135,6 +138,31 @@ class Transmon(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
         hamiltonian_mat[ind + 1, ind] = -self.EJ / 2.0
         return hamiltonian_mat
 
+    def _hamiltonian_components(
+        self, param_name: str
+    ) -> Optional[base.HamiltonianComponents]:
+        n_vals = np.arange(-self.ncut, self.ncut + 1)
+        josephson_mat = -self.cos_phi_operator()
+        if param_name == "EJ":
+            charging_mat = np.diag(4.0 * self.EC * (n_vals - self.ng) ** 2)
+            return charging_mat, [(lambda EJ: EJ, josephson_mat)]
+        if param_name == "EC":
+            charging_mat = np.diag(4.0 * (n_vals - self.ng) ** 2)
+            return self.EJ * josephson_mat, [(lambda EC: EC, charging_mat)]
+        if param_name == "ng":
+            # 4EC (n - ng)^2 = 4EC n^2 - 8EC ng n + 4EC ng^2
+            hamiltonian_const = (
+                np.diag(4.0 * self.EC * n_vals ** 2) + self.EJ * josephson_mat
+            )
+            return (
+                hamiltonian_const,
+                [
+                    (lambda ng: ng, np.diag(-8.0 * self.EC * n_vals)),
+                    (lambda ng: ng ** 2, 4.0 * self.EC * np.eye(self.hilbertdim())),
+                ],
+            )
+        return None
+
     def d_hamiltonian_d_ng(self) -> ndarray:
         """Returns operator representing a derivative of the Hamiltonian with respect to charge offset `ng`."""
         return -8 * self.EC * self.n_operator()
@@ -273,6 +301,49 @@ class Transmon(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
             energy=evals[which],
         )
 
+    def _wavefunctions_bulk(
+        self,
+        esys: Tuple[ndarray, ndarray],
+        wavefunc_indices: Sequence[int],
+        phi_grid: Grid1d,
+        out: Optional[ndarray] = None,
+    ) -> ndarray:
+        _, evecs = esys
+        wavefunc_indices = list(wavefunc_indices)
+        n_vals = np.arange(-self.ncut, self.ncut + 1)
+        phi_basis_labels = phi_grid.make_linspace()
+        # charge basis states in phase representation, evaluated on the grid
+        basis_vals = np.exp(1j * np.outer(n_vals, phi_basis_labels)) / math.sqrt(
+            2 * np.pi
+        )
+        # phase factors 1j**which as used in `wavefunction`
+        phase_factors = np.asarray([1, 1j, -1, -1j])[np.asarray(wavefunc_indices) % 4]
+        amplitudes = np.matmul(evecs[:, wavefunc_indices].T, basis_vals, out=out)
+        amplitudes *= phase_factors[:, np.newaxis]
+        return amplitudes
+
+    @staticmethod
+    def _dispersion_from_extremes(
+        energy_table_1: ndarray,
+        energy_table_2: ndarray,
+        transitions: Union[Tuple[int], Tuple[Tuple[int], ...]],
+        levels: Optional[Tuple[int]],
+    ) -> ndarray:
+        """Returns dispersions of the given levels (or, if `levels` is None, of the
+        given transitions) for all parameter values, based on the energy tables
+        computed at the two extremal values of the dispersion parameter."""
+        if levels is not None:
+            levels = list(levels)
+            return np.abs(energy_table_1[:, levels] - energy_table_2[:, levels]).T
+        i_levels, j_levels = np.atleast_2d(transitions).T
+        transition_energies_1 = np.abs(
+            energy_table_1[:, i_levels] - energy_table_1[:, j_levels]
+        )
+        transition_energies_2 = np.abs(
+            energy_table_2[:, i_levels] - energy_table_2[:, j_levels]
+        )
+        return np.abs(transition_energies_1 - transition_energies_2).T
+
     def _compute_dispersion(
         self,
         dispersion_name: str,
@@ -314,35 +385,10 @@ class Transmon(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
         )
         self.ng = previous_ng
 
-        if levels is not None:
-            dispersion = np.asarray(
-                [
-                    [
-                        np.abs(
-                            specdata_ng_0.energy_table[param_index, j]
-                            - specdata_ng_05.energy_table[param_index, j]
-                        )
-                        for param_index, _ in enumerate(param_vals)
-                    ]
-                    for j in levels
-                ]
-            )
-            return specdata_ng_0.energy_table, dispersion
-
-        dispersion = []
-        for i, j in transitions:
-            list_ij = []
-            for param_index, _ in enumerate(param_vals):
-                ei_0 = specdata_ng_0.energy_table[param_index, i]
-                ei_05 = specdata_ng_05.energy_table[param_index, i]
-                ej_0 = specdata_ng_0.energy_table[param_index, j]
-                ej_05 = specdata_ng_05.energy_table[param_index, j]
-                list_ij.append(
-                    np.max([np.abs(ei_0 - ej_0), np.abs(ei_05 - ej_05)])
-                    - np.min([np.abs(ei_0 - ej_0), np.abs(ei_05 - ej_05)])
-                )
-            dispersion.append(list_ij)
-        return specdata_ng_0.energy_table, np.asarray(dispersion)
+        dispersion = self._dispersion_from_extremes(
+            specdata_ng_0.energy_table, specdata_ng_05.energy_table, transitions, levels
+        )
+        return specdata_ng_0.energy_table, dispersion
 
 
 # — Flux-tunable Cooper pair box / transmon———————————————————————————————————————————
@@ -411,9 +457,12 @@ class TunableTransmon(Transmon, serializers.Serializable, NoisySystem):
     def EJ(self) -> float:  # type: ignore
         """This is the effective, flux dependent Josephson energy, playing the role
         of EJ in the parent class `Transmon`"""
-        return self.EJmax * np.sqrt(
-            np.cos(np.pi * self.flux) ** 2
-            + self.d ** 2 * np.sin(np.pi * self.flux) ** 2
+        return self._effective_EJ(self.EJmax, self.d, self.flux)
+
+    @staticmethod
+    def _effective_EJ(EJmax: float, d: float, flux: float) -> float:
+        return EJmax * np.sqrt(
+            np.cos(np.pi * flux) ** 2 + d ** 2 * np.sin(np.pi * flux) ** 2
         )
 
     @staticmethod
@@ -439,6 +488,30 @@ class TunableTransmon(Transmon, serializers.Serializable, NoisySystem):
             "t1_charge_impedance",
         ]
 
+    def _hamiltonian_components(
+        self, param_name: str
+    ) -> Optional[base.HamiltonianComponents]:
+        if param_name == "EJ":
+            # not an independent parameter here
+            return None
+        if param_name not in ["EJmax", "d", "flux"]:
+            return super()._hamiltonian_components(param_name)
+
+        # The parent-class decomposition with respect to EJ separates charging and
+        # Josephson terms; only the effective EJ depends on EJmax, d, and flux.
+        charging_mat, [(_, josephson_mat)] = super()._hamiltonian_components("EJ")
+        if param_name == "EJmax":
+            coefficient_func = functools.partial(
+                self._effective_EJ, d=self.d, flux=self.flux
+            )
+        elif param_name == "d":
+            coefficient_func = functools.partial(
+                self._effective_EJ, self.EJmax, flux=self.flux
+            )
+        else:
+            coefficient_func = functools.partial(self._effective_EJ, self.EJmax, self.d)
+        return charging_mat, [(coefficient_func, josephson_mat)]
+
     def d_hamiltonian_d_flux(self) -> ndarray:
         """Returns operator representing a derivative of the Hamiltonian with respect
         to `flux`."""
@@ -496,32 +569,10 @@ class TunableTransmon(Transmon, serializers.Serializable, NoisySystem):
         )
         self.flux = previous_flux
 
-        if levels is not None:
-            dispersion = np.asarray(
-                [
-                    [
-                        np.abs(
-                            specdata_flux_0.energy_table[param_index, j]
-                            - specdata_flux_05.energy_table[param_index, j]
-                        )
-                        for param_index, _ in enumerate(param_vals)
-                    ]
-                    for j in levels
-                ]
-            )
-            return specdata_flux_0.energy_table, dispersion
-
-        dispersion = []
-        for i, j in transitions:
-            list_ij = []
-            for param_index, _ in enumerate(param_vals):
-                ei_0 = specdata_flux_0.energy_table[param_index, i]
-                ei_05 = specdata_flux_05.energy_table[param_index, i]
-                ej_0 = specdata_flux_0.energy_table[param_index, j]
-                ej_05 = specdata_flux_05.energy_table[param_index, j]
-                list_ij.append(
-                    np.max([np.abs(ei_0 - ej_0), np.abs(ei_05 - ej_05)])
-                    - np.min([np.abs(ei_0 - ej_0), np.abs(ei_05 - ej_05)])
-                )
-            dispersion.append(list_ij)
-        return specdata_flux_0.energy_table, np.asarray(dispersion)
+        dispersion = self._dispersion_from_extremes(
+            specdata_flux_0.energy_table,
+            specdata_flux_05.energy_table,
+            transitions,
+            levels,
+        )
+        return specdata_flux_0.energy_table, dispersion
@@ -30,7 +30,6 @@ import scqubits.core.discretization as discretization
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
-import scqubits.settings as settings
 import scqubits.ui.qubit_widget as ui
 import scqubits.utils.plotting as plot
 import scqubits.utils.spectrum_utils as spec_utils
@@ -104,6 +103,8 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
     dEJ = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     dCJ = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ng = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    flux = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    grid = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ncut = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
 
     def __init__(
@@ -212,31 +213,6 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         if sender is self.grid:
             self.broadcast("QUANTUMSYSTEM_UPDATE")
 
-    def _evals_calc(self, evals_count: int) -> ndarray:
-        hamiltonian_mat = self.hamiltonian()
-        evals = sparse.linalg.eigsh(
-            hamiltonian_mat,
-            k=evals_count,
-            sigma=0.0,
-            which="LM",
-            return_eigenvectors=False,
-            v0=settings.RANDOM_ARRAY[: self.hilbertdim()],
-        )
-        return np.sort(evals)
-
-    def _esys_calc(self, evals_count: int) -> Tuple[ndarray, ndarray]:
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sparse.linalg.eigsh(
-            hamiltonian_mat,
-            k=evals_count,
-            sigma=0.0,
-            which="LM",
-            return_eigenvectors=True,
-            v0=settings.RANDOM_ARRAY[: self.hilbertdim()],
-        )
-        evals, evecs = spec_utils.order_eigensystem(evals, evecs)
-        return evals, evecs
-
     def get_ECS(self) -> float:
         return 1 / (1 / self.EC + 1 / self.ECJ)
 
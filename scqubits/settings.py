@@ -24,7 +24,7 @@ Matplotlib.
 
 import warnings
 
-from typing import Any, Type, Union
+from typing import Any, Optional, Type, Union
 
 import matplotlib as mpl
 import numpy as np
@@ -117,6 +117,49 @@ DESPINE = True
 # This is a setting for number of points in stencil to approximate derivatives
 STENCIL = 7
 
+# For dense diagonalization, the full spectrum is obtained with LAPACK's
+# divide-and-conquer driver whenever the number of requested eigenvalues exceeds
+# this fraction of the Hilbert space dimension. Below it, only the requested subset
+# of eigenvalues is computed.
+EVD_FRACTION_THRESHOLD = 0.2
+
+# Dense Hamiltonians of dimension SPARSE_EIGSH_MIN_DIMENSION and larger with at most
+# a fraction SPARSE_EIGSH_MAX_DENSITY of nonzero matrix elements are diagonalized by
+# shift-invert Lanczos (ARPACK) whenever fewer than SPARSE_EIGSH_MAX_FRACTION times
+# the dimension eigenvalues are requested.
+SPARSE_EIGSH_MIN_DIMENSION = 400
+SPARSE_EIGSH_MAX_DENSITY = 0.1
+SPARSE_EIGSH_MAX_FRACTION = 0.1
+
+# If USE_GPU is set, dense Hamiltonians of dimension GPU_EIGH_MIN_DIMENSION and
+# larger are diagonalized on the GPU (requires the optional package CuPy).
+USE_GPU = False
+GPU_EIGH_MIN_DIMENSION = 2000
+
+# Parameter sweeps over dense Hamiltonians up to this dimension are diagonalized in
+# batches of stacked matrices (numpy's batched eigh); the memory occupied by each
+# stack of matrices is limited to BATCHED_EIGH_MAX_BYTES.
+BATCHED_EIGH_MAX_DIMENSION = 64
+BATCHED_EIGH_MAX_BYTES = 2 ** 28
+
+# Each qubit keeps the results of its EIGEN_CACHE_SIZE most recent calls of
+# eigenvals/eigensys and reuses them for identical parameters (0: no caching).
+EIGEN_CACHE_SIZE = 4
+
+# The results of the SWEEP_CACHE_SIZE most recent calls of get_spectrum_vs_paramvals
+# are kept in memory and reused when a sweep is repeated for identical qubit
+# parameters (0: no caching). If SWEEP_CACHE_DIR is set to a directory, sweep
+# results are additionally stored there and reused across sessions.
+# Sweeps with eigenstate tables larger than SWEEP_CACHE_MAX_STATE_BYTES are
+# not cached.
+SWEEP_CACHE_SIZE = 4
+SWEEP_CACHE_DIR: Optional[str] = None
+SWEEP_CACHE_MAX_STATE_BYTES = 2 ** 26
+
+# Eigenstate tables of parameter sweeps larger than STATE_TABLE_MEMMAP_BYTES are
+# kept in a temporary file (np.memmap) rather than in memory (None: never).
+STATE_TABLE_MEMMAP_BYTES: Optional[int] = 2 ** 32
+
 # global random number generator for consistent initial state vector v0 in ARPACK
 SEED = 63142
 RNG = np.random.default_rng(seed=SEED)
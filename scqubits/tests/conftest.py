@@ -22,6 +22,7 @@ import scqubits as scq
 import scqubits.settings
 import scqubits.utils.plotting as plot
 
+from scqubits.core.qubit_base import QubitBaseClass1d
 from scqubits.core.storage import SpectrumData
 from scqubits.settings import IN_IPYTHON
 
@@ -201,6 +202,11 @@ class StandardTests(BaseTest):
         self.qbt = self.qbt_type(**specdata.system_params)
         self.qbt.plot_wavefunction(esys=None, which=5, mode="real")
         self.qbt.plot_wavefunction(esys=None, which=9, mode="abs_sqr")
+        if isinstance(self.qbt, QubitBaseClass1d):
+            _, axes = plt.subplots()
+            for fig_ax in [(), (None, None), axes]:
+                with pytest.raises(ValueError):
+                    self.qbt.plot_wavefunction(esys=None, which=1, fig_ax=fig_ax)
 
     def test_plot_evals_vs_paramvals(self, num_cpus, io_type):
         testname = self.file_str + "_1." + io_type
@@ -0,0 +1,53 @@
+# test_constants.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019 and later, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import pytest
+
+from scqubits.core.constants import MODE_FUNC_DICT
+
+complex_array = np.asarray([[1.0 + 2.0j, -0.5j], [-3.0, 0.25 - 0.75j]])
+real_array = np.asarray([[1.0, -2.0], [0.0, -0.5]])
+
+expected_by_mode = {
+    "abs_sqr": lambda x: np.abs(x) ** 2,
+    "abs": np.abs,
+    "real": np.real,
+    "imag": np.imag,
+}
+
+
+@pytest.mark.parametrize("x", [complex_array, real_array])
+@pytest.mark.parametrize("mode", list(MODE_FUNC_DICT))
+def test_mode_func(mode, x):
+    x_copy = x.copy()
+    result = MODE_FUNC_DICT[mode](x)
+    assert np.allclose(result, expected_by_mode[mode](x))
+    assert np.array_equal(x, x_copy)
+
+
+@pytest.mark.parametrize("x", [complex_array, real_array])
+@pytest.mark.parametrize("mode", list(MODE_FUNC_DICT))
+def test_mode_func_out(mode, x):
+    x_copy = x.copy()
+    out = np.full(x.shape, np.nan)
+    result = MODE_FUNC_DICT[mode](x, out=out)
+    assert result is out
+    assert np.allclose(out, expected_by_mode[mode](x))
+    assert np.array_equal(x, x_copy)
+
+
+def test_imag_of_real_array_writable():
+    result = MODE_FUNC_DICT["imag"](real_array)
+    assert np.array_equal(result, np.zeros_like(real_array))
+    result += 1.0
+    assert np.array_equal(real_array, [[1.0, -2.0], [0.0, -0.5]])
@@ -11,8 +11,10 @@
 ############################################################################
 
 import numpy as np
+import pytest
 
 from scqubits import Fluxonium
+from scqubits.core.discretization import Grid1d
 from scqubits.tests.conftest import StandardTests
 
 
@@ -26,3 +28,70 @@ class TestFluxonium(StandardTests):
         cls.op2_str = "phi_operator"
         cls.param_name = "flux"
         cls.param_list = np.linspace(0.45, 0.55, 50)
+
+    @pytest.mark.parametrize("param_name, param_val", [("EJ", 7.3), ("flux", 0.31)])
+    def test_hamiltonian_components(self, param_name, param_val):
+        self.qbt = Fluxonium.create()
+        components = self.qbt._hamiltonian_components(param_name)
+        hamiltonian_mat = self.qbt._hamiltonian_from_components(components, param_val)
+        buffers = self.qbt._hamiltonian_buffers(components)
+        hamiltonian_buffered = self.qbt._hamiltonian_from_components(
+            components, param_val, buffers=buffers
+        )
+        setattr(self.qbt, param_name, param_val)
+        assert np.allclose(hamiltonian_mat, self.qbt.hamiltonian())
+        assert np.allclose(hamiltonian_buffered, self.qbt.hamiltonian())
+
+    def test_dispersion_matches_parametersweep(self, monkeypatch):
+        self.qbt = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, flux=0.0, cutoff=60)
+        EL_vals = np.linspace(0.4, 0.6, 3)
+        cache_size = len(Fluxonium._sweep_cache)
+        energies, dispersions = self.qbt._compute_dispersion(
+            "flux", "EL", EL_vals, transitions=((0, 1), (1, 2)), point_count=5
+        )
+        assert len(Fluxonium._sweep_cache) == cache_size
+        # reference: generic ParameterSweep path, used without a decomposition
+        monkeypatch.setattr(self.qbt, "_hamiltonian_components", lambda name: None)
+        energies_ref, dispersions_ref = self.qbt._compute_dispersion(
+            "flux", "EL", EL_vals, transitions=((0, 1), (1, 2)), point_count=5
+        )
+        assert energies.shape == energies_ref.shape
+        assert np.allclose(energies, energies_ref)
+        assert np.allclose(dispersions, dispersions_ref)
+
+    @pytest.mark.parametrize(
+        "wavefunc_indices", [[0, 1, 2, 3, 4, 5, 6, 7], [6, 1, 3, 4]]
+    )
+    @pytest.mark.parametrize("qbt_type", [Fluxonium])
+    def test_wavefunctions_bulk(self, qbt_type, wavefunc_indices):
+        self.qbt = qbt_type.create()
+        esys = self.qbt.eigensys(evals_count=8)
+        phi_grid = Grid1d(-np.pi, np.pi, 51)
+        expected = [
+            self.qbt.wavefunction(esys, which=index, phi_grid=phi_grid).amplitudes
+            for index in wavefunc_indices
+        ]
+        amplitudes = self.qbt._wavefunctions_bulk(esys, wavefunc_indices, phi_grid)
+        assert np.allclose(amplitudes, expected)
+        out = np.empty(
+            (len(wavefunc_indices), phi_grid.pt_count), self.qbt._wavefunction_dtype
+        )
+        amplitudes = self.qbt._wavefunctions_bulk(
+            esys, wavefunc_indices, phi_grid, out=out
+        )
+        assert amplitudes is out
+        assert np.allclose(amplitudes, expected)
+
+    def test_complex_esys_wavefunctions(self):
+        self.qbt = Fluxonium.create()
+        evals, evecs = self.qbt.eigensys(evals_count=4)
+        esys = evals, evecs * np.exp(0.3j)
+        phi_grid = Grid1d(-np.pi, np.pi, 51)
+        expected = [
+            self.qbt.wavefunction(esys, which=index, phi_grid=phi_grid).amplitudes
+            for index in range(4)
+        ]
+        amplitudes = self.qbt._wavefunctions_bulk(esys, range(4), phi_grid)
+        assert np.allclose(amplitudes, expected)
+        for mode in ["real", "imag", "abs_sqr"]:
+            self.qbt.plot_wavefunction(esys=esys, which=[0, 1, 2, 3], mode=mode)
@@ -0,0 +1,35 @@
+# test_spectrum_utils.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019 and later, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+
+from scqubits.utils.spectrum_utils import standardize_sign, standardize_sign_batch
+
+
+def test_standardize_sign_batch():
+    rng = np.random.RandomState(1)
+    real_arrays = rng.uniform(-1.0, 1.0, (6, 11))
+    # rows led by near-zero amplitudes, as in the tails of a wavefunction
+    real_arrays[0, :4] = [1e-17, -1e-16, 3e-18, 0.0]
+    real_arrays[1, :5] = -1e-15
+    real_arrays[2, :5] = [1e-300, 0.0, 0.0, 0.0, 0.0]
+    real_arrays[3, :5] = [-1e-300, 0.0, 0.0, 0.0, 0.0]
+    expected = np.asarray([standardize_sign(row) for row in real_arrays])
+    result = standardize_sign_batch(real_arrays.copy())
+    assert np.array_equal(result, expected)
+
+
+def test_standardize_sign_batch_in_place():
+    real_arrays = np.asarray([[-1.0, -2.0, 3.0], [1.0, -2.0, 3.0]])
+    result = standardize_sign_batch(real_arrays)
+    assert result is real_arrays
+    assert np.array_equal(real_arrays, [[1.0, 2.0, -3.0], [1.0, -2.0, 3.0]])
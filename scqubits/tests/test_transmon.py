@@ -10,10 +10,17 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import threading
+
 import numpy as np
 import pytest
 
-from scqubits import Transmon
+from scipy import sparse
+
+import scqubits.settings as settings
+
+from scqubits import Transmon, TunableTransmon
+from scqubits.core.discretization import Grid1d
 from scqubits.tests.conftest import StandardTests
 
 
@@ -32,3 +39,330 @@ class TestTransmon(StandardTests):
     def test_plot_n_wavefunction(self):
         self.qbt = Transmon(EJ=1.0, EC=1.0, ng=0.0, ncut=10)
         self.qbt.plot_n_wavefunction(esys=None, which=1, mode="real")
+
+    def test_eigenvals_cache_reset_on_param_change(self):
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=20)
+        evals = self.qbt.eigenvals()
+        evals[0] = 0.0  # must not alter cached data
+        assert np.allclose(self.qbt.eigenvals(), self.qbt._evals_calc(6))
+        self.qbt.ng = 0.3
+        reference = Transmon(EJ=20.0, EC=1.0, ng=0.3, ncut=20)
+        assert np.allclose(self.qbt.eigenvals(), reference.eigenvals())
+
+    def test_eigenvals_cache_keyed_by_params(self):
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=20)
+        reference = Transmon(EJ=20.0, EC=1.0, ng=0.3, ncut=20)
+        evals_ng0 = self.qbt.eigenvals()
+        # bypass the watched property: no broadcast, only the cache key changes
+        self.qbt.__dict__["ng"] = 0.3
+        assert np.allclose(self.qbt.eigenvals(), reference.eigenvals())
+        self.qbt.__dict__["ng"] = 0.0
+        assert np.allclose(self.qbt.eigenvals(), evals_ng0)
+
+    @pytest.mark.parametrize(
+        "qbt_type, param_name, param_val",
+        [
+            (Transmon, "EJ", 17.3),
+            (Transmon, "EC", 0.7),
+            (Transmon, "ng", 0.27),
+            (TunableTransmon, "EJmax", 17.3),
+            (TunableTransmon, "d", 0.23),
+            (TunableTransmon, "flux", 0.31),
+            (TunableTransmon, "ng", 0.27),
+        ],
+    )
+    def test_hamiltonian_components(self, qbt_type, param_name, param_val):
+        self.qbt = qbt_type.create()
+        components = self.qbt._hamiltonian_components(param_name)
+        hamiltonian_mat = self.qbt._hamiltonian_from_components(components, param_val)
+        buffers = self.qbt._hamiltonian_buffers(components)
+        hamiltonian_buffered = self.qbt._hamiltonian_from_components(
+            components, param_val, buffers=buffers
+        )
+        setattr(self.qbt, param_name, param_val)
+        assert np.allclose(hamiltonian_mat, self.qbt.hamiltonian())
+        assert np.allclose(hamiltonian_buffered, self.qbt.hamiltonian())
+
+    @staticmethod
+    def _fail_to_recompute(param_name):
+        raise AssertionError("sweep recomputed despite cached result")
+
+    def test_sweep_cache_hit(self, monkeypatch):
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=10)
+        ng_vals = np.linspace(-0.5, 0.5, 7)
+        specdata = self.qbt.get_spectrum_vs_paramvals("ng", ng_vals)
+        monkeypatch.setattr(
+            self.qbt, "_hamiltonian_components", self._fail_to_recompute
+        )
+        cached_specdata = self.qbt.get_spectrum_vs_paramvals("ng", ng_vals)
+        assert np.allclose(cached_specdata.energy_table, specdata.energy_table)
+
+    def test_sweep_cache_invalidated_by_param_change(self):
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=10)
+        ng_vals = np.linspace(-0.5, 0.5, 7)
+        self.qbt.get_spectrum_vs_paramvals("ng", ng_vals)
+        self.qbt.EJ = 15.0
+        reference = Transmon(EJ=15.0, EC=1.0, ng=0.0, ncut=10)
+        reference_energies = [
+            reference.set_and_return("ng", ng).eigenvals() for ng in ng_vals
+        ]
+        assert np.allclose(
+            self.qbt.get_spectrum_vs_paramvals("ng", ng_vals).energy_table,
+            reference_energies,
+        )
+
+    def test_sweep_cache_file_roundtrip(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "SWEEP_CACHE_DIR", str(tmp_path))
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=10)
+        ng_vals = np.linspace(-0.5, 0.5, 7)
+        specdata = self.qbt.get_spectrum_vs_paramvals(
+            "ng", ng_vals, get_eigenstates=True
+        )
+        assert len(list(tmp_path.glob("sweep_*.npz"))) == 1
+        # with an empty in-memory cache, the sweep is read from file
+        monkeypatch.setattr(Transmon, "_sweep_cache", type(Transmon._sweep_cache)())
+        monkeypatch.setattr(
+            self.qbt, "_hamiltonian_components", self._fail_to_recompute
+        )
+        loaded_specdata = self.qbt.get_spectrum_vs_paramvals(
+            "ng", ng_vals, get_eigenstates=True
+        )
+        assert np.allclose(loaded_specdata.energy_table, specdata.energy_table)
+        assert np.allclose(
+            np.asarray(loaded_specdata.state_table), np.asarray(specdata.state_table)
+        )
+
+    def test_sweep_cache_ignores_truncated_file(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "SWEEP_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(Transmon, "_sweep_cache", type(Transmon._sweep_cache)())
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=10)
+        ng_vals = np.linspace(-0.5, 0.5, 7)
+        specdata = self.qbt.get_spectrum_vs_paramvals(
+            "ng", ng_vals, get_eigenstates=True
+        )
+        [sweep_file] = tmp_path.glob("sweep_*.npz")
+        sweep_file.write_bytes(sweep_file.read_bytes()[:100])
+        monkeypatch.setattr(Transmon, "_sweep_cache", type(Transmon._sweep_cache)())
+        recomputed_specdata = self.qbt.get_spectrum_vs_paramvals(
+            "ng", ng_vals, get_eigenstates=True
+        )
+        assert np.allclose(recomputed_specdata.energy_table, specdata.energy_table)
+        # the recomputed sweep replaces the truncated file; no temporary files remain
+        assert [path.name for path in tmp_path.iterdir()] == [sweep_file.name]
+        monkeypatch.setattr(Transmon, "_sweep_cache", type(Transmon._sweep_cache)())
+        monkeypatch.setattr(
+            self.qbt, "_hamiltonian_components", self._fail_to_recompute
+        )
+        loaded_specdata = self.qbt.get_spectrum_vs_paramvals(
+            "ng", ng_vals, get_eigenstates=True
+        )
+        assert np.allclose(loaded_specdata.energy_table, specdata.energy_table)
+
+    def test_sweep_cache_skips_large_state_tables(self, monkeypatch):
+        monkeypatch.setattr(settings, "SWEEP_CACHE_MAX_STATE_BYTES", 0)
+        monkeypatch.setattr(Transmon, "_sweep_cache", type(Transmon._sweep_cache)())
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=10)
+        ng_vals = np.linspace(-0.5, 0.5, 7)
+        self.qbt.get_spectrum_vs_paramvals("ng", ng_vals, get_eigenstates=True)
+        assert len(Transmon._sweep_cache) == 0
+
+    @pytest.mark.parametrize("ncut", [10, 40])
+    def test_memmap_state_table(self, monkeypatch, ncut):
+        # ncut=10: batched diagonalization; ncut=40: one matrix at a time
+        monkeypatch.setattr(Transmon, "_sweep_cache", type(Transmon._sweep_cache)())
+        monkeypatch.setattr(settings, "SWEEP_CACHE_SIZE", 0)
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=ncut)
+        ng_vals = np.linspace(-0.5, 0.5, 7)
+        specdata = self.qbt.get_spectrum_vs_paramvals(
+            "ng", ng_vals, get_eigenstates=True
+        )
+        assert isinstance(specdata.state_table, list)
+        monkeypatch.setattr(settings, "STATE_TABLE_MEMMAP_BYTES", 1)
+        specdata_memmap = self.qbt.get_spectrum_vs_paramvals(
+            "ng", ng_vals, get_eigenstates=True
+        )
+        assert isinstance(specdata_memmap.state_table, np.memmap)
+        assert np.allclose(specdata_memmap.energy_table, specdata.energy_table)
+        assert np.allclose(
+            np.asarray(specdata_memmap.state_table), np.asarray(specdata.state_table)
+        )
+
+    @staticmethod
+    def _dispersion_by_loop(
+        qbt,
+        dispersion_name,
+        dispersion_vals,
+        param_name,
+        param_vals,
+        transitions,
+        levels,
+    ):
+        # reference values, computed point by point as before the vectorization
+        max_level = np.max(transitions) if levels is None else np.max(levels)
+        energies = np.empty((len(dispersion_vals), len(param_vals), max_level + 1))
+        for disp_index, disp_val in enumerate(dispersion_vals):
+            for param_index, param_val in enumerate(param_vals):
+                setattr(qbt, dispersion_name, disp_val)
+                setattr(qbt, param_name, param_val)
+                energies[disp_index, param_index] = qbt.eigenvals(
+                    evals_count=max_level + 1
+                )
+        if levels is not None:
+            return np.asarray(
+                [
+                    np.max(energies[:, :, j], axis=0)
+                    - np.min(energies[:, :, j], axis=0)
+                    for j in levels
+                ]
+            )
+        dispersion = []
+        for i, j in transitions:
+            energy_ij = np.abs(energies[:, :, i] - energies[:, :, j])
+            dispersion.append(np.max(energy_ij, axis=0) - np.min(energy_ij, axis=0))
+        return np.asarray(dispersion)
+
+    @pytest.mark.parametrize(
+        "transitions, levels",
+        [(((0, 1), (0, 2), (1, 3)), None), ((0, 1), None), ((0, 1), (0, 1, 2))],
+    )
+    @pytest.mark.parametrize("dispersion_name", ["ng", "EC"])
+    def test_dispersion_matches_loop(self, dispersion_name, transitions, levels):
+        # "ng" takes the two-extremes shortcut, "EC" the generic np.ptp reduction
+        self.qbt = Transmon(EJ=5.0, EC=1.0, ng=0.0, ncut=10)
+        param_vals = np.linspace(2.0, 8.0, 4)
+        point_count = 5
+        specdata = self.qbt.get_dispersion_vs_paramvals(
+            dispersion_name,
+            "EJ",
+            param_vals.copy(),
+            transitions=transitions,
+            levels=levels,
+            point_count=point_count,
+        )
+        if dispersion_name == "ng":
+            dispersion_vals = [0.0, 0.5]
+        else:
+            dispersion_vals = np.linspace(0.0, 1.0, point_count)
+        if levels is None and isinstance(transitions[0], int):
+            transitions = (transitions,)
+        reference = self._dispersion_by_loop(
+            Transmon(EJ=5.0, EC=1.0, ng=0.0, ncut=10),
+            dispersion_name,
+            dispersion_vals,
+            "EJ",
+            param_vals,
+            transitions,
+            levels,
+        )
+        assert np.allclose(specdata.dispersion, reference.T)
+
+    def test_sweep_releases_worker_threads(self, monkeypatch):
+        monkeypatch.setattr(Transmon, "_sweep_cache", type(Transmon._sweep_cache)())
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=10)
+        thread_count = threading.active_count()
+        specdata = self.qbt.get_spectrum_vs_paramvals(
+            "ng", np.linspace(-0.5, 0.5, 8), num_cpus=2
+        )
+        assert threading.active_count() == thread_count
+        reference = self.qbt._compute_spectrum_vs_paramvals(
+            "ng", np.linspace(-0.5, 0.5, 8), 6, False, False, num_cpus=1
+        )
+        assert np.allclose(specdata.energy_table, reference.energy_table)
+
+    def test_sweep_with_sparse_component(self, monkeypatch):
+        monkeypatch.setattr(Transmon, "_sweep_cache", type(Transmon._sweep_cache)())
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.0, ncut=10)
+        ng_vals = np.linspace(-0.5, 0.5, 5)
+        reference = self.qbt.get_spectrum_vs_paramvals("ng", ng_vals)
+        hamiltonian_components = self.qbt._hamiltonian_components
+
+        def sparse_components(param_name):
+            hamiltonian_const, coefficient_terms = hamiltonian_components(param_name)
+            coefficient_terms = [
+                (coefficient_func, sparse.csr_matrix(matrix))
+                for coefficient_func, matrix in coefficient_terms
+            ]
+            return hamiltonian_const, coefficient_terms
+
+        monkeypatch.setattr(self.qbt, "_hamiltonian_components", sparse_components)
+        assert not self.qbt._batched_eigh_applicable(sparse_components("ng"), 1)
+        specdata = self.qbt._compute_spectrum_vs_paramvals(
+            "ng", ng_vals, 6, False, False, num_cpus=1
+        )
+        assert np.allclose(specdata.energy_table, reference.energy_table)
+
+    def test_banded_eigensolver(self):
+        self.qbt = Transmon(EJ=20.0, EC=1.0, ng=0.3, ncut=30)
+        assert self.qbt._hamiltonian_bandwidth == 1
+        evals_count = 8
+        evals_dense, evecs_dense = np.linalg.eigh(self.qbt.hamiltonian())
+        evals_dense = evals_dense[:evals_count]
+        evecs_dense = evecs_dense[:, :evals_count]
+        assert np.allclose(self.qbt._evals_calc(evals_count), evals_dense)
+        evals, evecs = self.qbt._esys_calc(evals_count)
+        assert np.allclose(evals, evals_dense)
+        # eigenvectors agree up to sign
+        signs = np.sign(np.sum(evecs * evecs_dense, axis=0))
+        assert np.allclose(evecs * signs, evecs_dense)
+
+    @pytest.mark.parametrize(
+        "transitions, levels", [(((0, 1), (2, 5)), None), ((0, 1), (1, 5))]
+    )
+    def test_dispersion_beyond_truncated_dim(self, transitions, levels):
+        self.qbt = Transmon(EJ=5.0, EC=1.0, ng=0.0, ncut=10, truncated_dim=3)
+        param_vals = np.linspace(2.0, 8.0, 3)
+        specdata = self.qbt.get_dispersion_vs_paramvals(
+            "EC",
+            "EJ",
+            param_vals.copy(),
+            transitions=transitions,
+            levels=levels,
+            point_count=4,
+        )
+        reference = self._dispersion_by_loop(
+            Transmon(EJ=5.0, EC=1.0, ng=0.0, ncut=10),
+            "EC",
+            np.linspace(0.0, 1.0, 4),
+            "EJ",
+            param_vals,
+            transitions,
+            levels,
+        )
+        assert np.allclose(specdata.dispersion, reference.T)
+
+    def test_dispersion_builds_components_once_per_paramval(self, monkeypatch):
+        self.qbt = Transmon(EJ=5.0, EC=1.0, ng=0.0, ncut=10)
+        hamiltonian_components = self.qbt._hamiltonian_components
+        calls = []
+
+        def counting_components(param_name):
+            calls.append(param_name)
+            return hamiltonian_components(param_name)
+
+        monkeypatch.setattr(self.qbt, "_hamiltonian_components", counting_components)
+        param_vals = np.linspace(2.0, 8.0, 3)
+        self.qbt.get_dispersion_vs_paramvals("EC", "EJ", param_vals, point_count=4)
+        assert calls == ["EC"] * len(param_vals)
+
+    @pytest.mark.parametrize(
+        "wavefunc_indices", [[0, 1, 2, 3, 4, 5, 6, 7], [6, 1, 3, 4]]
+    )
+    @pytest.mark.parametrize("qbt_type", [Transmon, TunableTransmon])
+    def test_wavefunctions_bulk(self, qbt_type, wavefunc_indices):
+        self.qbt = qbt_type.create()
+        esys = self.qbt.eigensys(evals_count=8)
+        phi_grid = Grid1d(-np.pi, np.pi, 51)
+        expected = [
+            self.qbt.wavefunction(esys, which=index, phi_grid=phi_grid).amplitudes
+            for index in wavefunc_indices
+        ]
+        amplitudes = self.qbt._wavefunctions_bulk(esys, wavefunc_indices, phi_grid)
+        assert np.allclose(amplitudes, expected)
+        out = np.empty(
+            (len(wavefunc_indices), phi_grid.pt_count), self.qbt._wavefunction_dtype
+        )
+        amplitudes = self.qbt._wavefunctions_bulk(
+            esys, wavefunc_indices, phi_grid, out=out
+        )
+        assert amplitudes is out
+        assert np.allclose(amplitudes, expected)
@@ -9,7 +9,9 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
-from typing import Callable
+import contextlib
+
+from typing import Callable, ContextManager, Optional
 
 import scqubits.settings as settings
 
@@ -62,3 +64,24 @@ def get_map_method(num_cpus: int) -> Callable:
                 settings.MULTIPROC
             )
         )
+
+
+def limit_blas_threads(num_threads: Optional[int]) -> ContextManager:
+    """
+    Returns a context manager limiting the number of threads used by BLAS/LAPACK.
+    Used to avoid oversubscription of cores when several workers run eigensolvers
+    in parallel. Requires the optional package `threadpoolctl`; without it, and for
+    `num_threads=None`, the returned context manager does nothing.
+
+    Parameters
+    ----------
+    num_threads:
+        maximum number of BLAS threads, or None for no limit
+    """
+    if num_threads is None:
+        return contextlib.suppress()  # no-op context manager
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return contextlib.suppress()
+    return threadpool_limits(limits=num_threads, user_api="blas")
@@ -40,7 +40,12 @@ import scqubits.utils.misc as utils
 import scqubits.utils.plot_defaults as defaults
 
 if TYPE_CHECKING:
-    from scqubits.core.storage import SpectrumData, WaveFunction, WaveFunctionOnGrid
+    from scqubits.core.storage import (
+        SpectrumData,
+        WaveFunction,
+        WaveFunctionBatch,
+        WaveFunctionOnGrid,
+    )
 
 try:
     from labellines import labelLines
@@ -152,7 +157,7 @@ def _process_special_option(figure: Figure, axes: Axes, key: str, value: Any) ->
 
 
 def wavefunction1d(
-    wavefuncs: Union["WaveFunction", "List[WaveFunction]"],
+    wavefuncs: Union["WaveFunction", "List[WaveFunction]", "WaveFunctionBatch"],
     potential_vals: np.ndarray = None,
     offset: Union[float, Iterable[float]] = 0,
     scaling: Optional[float] = None,
@@ -164,7 +169,7 @@ def wavefunction1d(
     Parameters
     ----------
     wavefuncs:
-        basis and amplitude data of wave function to be plotted
+        basis and amplitude data of wave function(s) to be plotted
     potential_vals:
         potential energies, array length must match basis array of `wavefunc`
     offset:
@@ -178,29 +183,57 @@ def wavefunction1d(
     -------
         matplotlib objects for further editing
     """
+    # imported here: scqubits.core.storage itself imports this module
+    from scqubits.core.storage import WaveFunctionBatch
+
     fig, axes = kwargs.get("fig_ax") or plt.subplots()
 
     offset_list = [offset] if not isinstance(offset, (list, np.ndarray)) else offset
-    wavefunc_list = [wavefuncs] if not isinstance(wavefuncs, list) else wavefuncs
 
-    scale_constant = renormalization_factor(wavefunc_list[0], potential_vals)
-    for wavefunc in wavefunc_list:
-        wavefunc.amplitudes *= scale_constant
-
-    scale_factor = scaling or defaults.set_wavefunction_scaling(
-        wavefunc_list, potential_vals
-    )
+    if isinstance(wavefuncs, WaveFunctionBatch):
+        scale_constant = renormalization_factor(wavefuncs[0], potential_vals)
+        wavefuncs.amplitudes *= scale_constant
+        scale_factor = scaling or defaults.set_wavefunction_scaling(
+            wavefuncs, potential_vals
+        )
+        x_vals = wavefuncs.basis_labels
+        offset_array = np.asarray(offset_list)
+        y_vals_array = offset_array[:, np.newaxis] + scale_factor * wavefuncs.amplitudes
+        # all wave functions drawn in a single call, one line per row
+        axes.plot(x_vals, y_vals_array.T, **_extract_kwargs_options(kwargs, "plot"))
+        for y_vals, energy_offset in zip(y_vals_array, offset_array):
+            axes.fill_between(
+                x_vals,
+                y_vals,
+                energy_offset,
+                where=(y_vals != energy_offset),
+                interpolate=True,
+            )
+    else:
+        wavefunc_list = [wavefuncs] if not isinstance(wavefuncs, list) else wavefuncs
 
-    for wavefunction, energy_offset in zip(wavefunc_list, offset_list):
-        x_vals = wavefunction.basis_labels
-        y_vals = energy_offset + scale_factor * wavefunction.amplitudes
-        offset_vals = [energy_offset] * len(x_vals)
+        scale_constant = renormalization_factor(wavefunc_list[0], potential_vals)
+        for wavefunc in wavefunc_list:
+            wavefunc.amplitudes *= scale_constant
 
-        axes.plot(x_vals, y_vals, **_extract_kwargs_options(kwargs, "plot"))
-        axes.fill_between(
-            x_vals, y_vals, offset_vals, where=(y_vals != offset_vals), interpolate=True
+        scale_factor = scaling or defaults.set_wavefunction_scaling(
+            wavefunc_list, potential_vals
         )
 
+        for wavefunction, energy_offset in zip(wavefunc_list, offset_list):
+            x_vals = wavefunction.basis_labels
+            y_vals = energy_offset + scale_factor * wavefunction.amplitudes
+            offset_vals = [energy_offset] * len(x_vals)
+
+            axes.plot(x_vals, y_vals, **_extract_kwargs_options(kwargs, "plot"))
+            axes.fill_between(
+                x_vals,
+                y_vals,
+                offset_vals,
+                where=(y_vals != offset_vals),
+                interpolate=True,
+            )
+
     if potential_vals is not None:
         y_min = np.min(potential_vals)
         y_max = np.max(offset_list)
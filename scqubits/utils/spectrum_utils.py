@@ -42,6 +42,9 @@ def order_eigensystem(
     evecs:
         array containing eigenvectors; evecs[:, 0] is the first eigenvector etc.
     """
+    if np.all(evals[:-1] <= evals[1:]):
+        # already ordered, as returned by most eigensolvers
+        return evals, evecs
     ordered_evals_indices = evals.argsort()  # sort manually
     evals[:] = evals[ordered_evals_indices]
     evecs[:] = evecs[:, ordered_evals_indices]
@@ -97,6 +100,17 @@ def standardize_sign(real_array: np.ndarray) -> np.ndarray:
     return np.sign(np.sum(real_array[:halfway_position])) * real_array
 
 
+def standardize_sign_batch(real_arrays: np.ndarray) -> np.ndarray:
+    """Standardizes the signs of several real-valued wavefunctions, given as the
+    rows of a 2d array, in the same way as `standardize_sign`. The array is modified
+    in place and returned.
+    """
+    halfway_position = real_arrays.shape[1] // 2
+    signs = np.sign(np.sum(real_arrays[:, :halfway_position], axis=1))
+    real_arrays *= signs[:, np.newaxis]
+    return real_arrays
+
+
 # -Matrix elements and operators (outside qutip) --------------------------------------
 
 
@@ -159,6 +173,10 @@ def get_matrixelement_table(
     -------
         table of matrix elements
     """
+    if not isinstance(operator, qt.Qobj) and isinstance(state_table, np.ndarray):
+        # all matrix elements <v_n|operator|v_m> at once: V^dagger (operator V)
+        return state_table.conj().T @ operator.dot(state_table)
+
     if isinstance(operator, qt.Qobj):
         state_list = state_table
     else: